@@ -7,55 +7,105 @@ norminette errors in C projects.
 
 import os
 import sys
-import json
-import click
+import stat
+import asyncio
+import argparse
 import logging
-from pathlib import Path
-from typing import List, Optional
+from itertools import islice
+from html import escape as html_escape
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich.text import Text
 
-from ..core.scanner import NorminetteScanner
+from ..core.scanner import NorminetteScanner, NorminetteResult
 from ..core.parser import ErrorParser
 from ..core.formatter import AutoFormatter
 from ..core.aggregator import FileAggregator, FileStatus
-from ..dashboard.app import create_app
 
 # Initialize Rich console for beautiful output
 console = Console()
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Maximum number of norminette processes running at the same time
+MAX_CONCURRENT_SCANS = 32
 
-@click.group()
-@click.version_option(version="1.0.0")
-@click.option('--verbose', '-v', is_flag=True, help='Enable verbose output')
-def main(verbose):
-    """42-Norminette-Formatter - A comprehensive tool for managing norminette errors."""
-    if verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
-        console.print("[dim]Verbose mode enabled[/dim]")
+# Files passed to each norminette process; kept small so results stream in and
+# the MAX_CONCURRENT_SCANS workers all get a share of small projects
+SCAN_BATCH_SIZE = 8
+
+# Number of per-file status lines rendered together while formatting
+STATUS_BATCH_SIZE = 32
+
+# Rich markup for the status column of the files table
+_STATUS_STYLE = {
+    FileStatus.OK: "green",
+    FileStatus.WARNING: "yellow",
+    FileStatus.ERROR: "red",
+    FileStatus.CRITICAL: "bold red"
+}
+_STATUS_CELL = {
+    status: f"[{_STATUS_STYLE.get(status, 'white')}]{status.value}[/]"
+    for status in FileStatus
+}
+
+
+async def _scan_all(files: Iterable[str], on_result: Callable[[NorminetteResult, list], None]):
+    """
+    Scan files concurrently, passing each result and its analyses to on_result.
+
+    A fixed pool of worker coroutines pulls batches of paths from the shared
+    iterator, so files are only enumerated as fast as they are scanned, and
+    each batch is checked by a single norminette process.
+    """
+    scanner = NorminetteScanner()
+    parser = ErrorParser()
+    files = iter(files)
+
+    async def worker():
+        while True:
+            batch = list(islice(files, SCAN_BATCH_SIZE))
+            if not batch:
+                return
+            for result in await scanner.scan_files_async(batch):
+                analyses = parser.analyze_file_errors(result.errors) if result.errors else []
+                on_result(result, analyses)
+
+    await asyncio.gather(*(worker() for _ in range(MAX_CONCURRENT_SCANS)))
+
+
+def _path_mode(path: str) -> Optional[int]:
+    """Stat a path, returning its st_mode or None if it does not exist."""
+    try:
+        return os.stat(path).st_mode
+    except OSError:
+        return None
+
+
+def _scan_and_analyze(path: str, recursive: bool, on_result: Callable[[NorminetteResult, list], None],
+                      path_mode: Optional[int] = None):
+    """
+    Scan a file or directory, calling on_result for every file as it completes.
 
+    Norminette runs in up to MAX_CONCURRENT_SCANS subprocesses at once.
+    path_mode is the st_mode main() already read for the path; without it
+    the path is stat()ed here.
+    """
+    mode = path_mode if path_mode is not None else _path_mode(path)
+    if mode is not None and stat.S_ISREG(mode):
+        files = [path]
+    else:
+        files = NorminetteScanner.find_source_files(path, recursive)
+
+    asyncio.run(_scan_all(files, on_result))
 
-@main.command()
-@click.argument('path', type=click.Path(exists=True))
-@click.option('--recursive', '-r', is_flag=True, default=True, help='Scan directories recursively')
-@click.option('--output', '-o', type=click.Path(), help='Output file for results (JSON format)')
-@click.option('--filter-status', type=click.Choice(['OK', 'Error', 'Warning', 'Critical']), 
-              help='Filter results by status')
-@click.option('--filter-type', help='Filter results by error type')
-@click.option('--show-details', is_flag=True, help='Show detailed error information')
-def scan(path, recursive, output, filter_status, filter_type, show_details):
+
+def scan(path, recursive=True, output=None, filter_status=None, filter_type=None, show_details=False, compact=False,
+         path_mode=None):
     """Scan a file or directory for norminette errors."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
     console.print(f"[bold blue]Scanning:[/bold blue] {path}")
     
-    scanner = NorminetteScanner()
-    parser = ErrorParser()
     aggregator = FileAggregator()
     
     with Progress(
@@ -66,22 +116,12 @@ def scan(path, recursive, output, filter_status, filter_type, show_details):
         task = progress.add_task("Scanning files...", total=None)
         
         try:
-            if os.path.isfile(path):
-                # Scan single file
-                result = scanner.scan_file(path)
-                results = [result]
-            else:
-                # Scan directory
-                results = scanner.scan_directory(path, recursive=recursive)
-            
-            progress.update(task, description="Analyzing errors...")
-            
-            # Process results
-            for result in results:
-                analyses = []
-                if result.errors:
-                    analyses = parser.analyze_file_errors(result.errors)
+            # Scan and analyze files, aggregating results as they complete
+            def on_result(result, analyses):
                 aggregator.add_scan_result(result, analyses)
+                progress.update(task, description=f"Scanning files... ({len(aggregator.files)} done)")
+            
+            _scan_and_analyze(path, recursive, on_result, path_mode)
             
             progress.update(task, description="Generating report...")
             
@@ -97,26 +137,20 @@ def scan(path, recursive, output, filter_status, filter_type, show_details):
     
     # Save to file if requested
     if output:
-        save_results_to_file(aggregator, output)
+        save_results_to_file(aggregator, output, compact)
         console.print(f"[green]Results saved to {output}[/green]")
 
 
-@main.command()
-@click.argument('path', type=click.Path(exists=True))
-@click.option('--recursive', '-r', is_flag=True, default=True, help='Process directories recursively')
-@click.option('--auto-fixable-only', is_flag=True, help='Only fix auto-fixable errors')
-@click.option('--backup/--no-backup', default=True, help='Create backups before formatting')
-@click.option('--dry-run', is_flag=True, help='Show what would be fixed without making changes')
-@click.option('--filter-type', help='Only fix specific error types')
-def format(path, recursive, auto_fixable_only, backup, dry_run, filter_type):
+def format(path, recursive=True, auto_fixable_only=False, backup=True, dry_run=False, filter_type=None,
+           path_mode=None):
     """Format files to fix norminette errors."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
     console.print(f"[bold yellow]Formatting:[/bold yellow] {path}")
     
     if dry_run:
         console.print("[dim]Running in dry-run mode - no changes will be made[/dim]")
     
-    scanner = NorminetteScanner()
-    parser = ErrorParser()
     formatter = AutoFormatter(backup_enabled=backup)
     
     # First, scan to identify files with errors
@@ -128,31 +162,31 @@ def format(path, recursive, auto_fixable_only, backup, dry_run, filter_type):
         scan_task = progress.add_task("Scanning for errors...", total=None)
         
         try:
-            if os.path.isfile(path):
-                results = [scanner.scan_file(path)]
-            else:
-                results = scanner.scan_directory(path, recursive=recursive)
-            
-            progress.update(scan_task, description="Analyzing errors...")
-            
-            # Process and filter results
+            # Scan, analyze and filter files as they complete
             files_to_format = []
-            for result in results:
-                if result.status == "OK":
-                    continue
-                
-                analyses = parser.analyze_file_errors(result.errors) if result.errors else []
+            scanned = 0
+            
+            def on_result(result, analyses):
+                nonlocal scanned
+                scanned += 1
+                progress.update(scan_task, description=f"Scanning for errors... ({scanned} done)")
                 
-                # Apply filters
-                if auto_fixable_only:
-                    analyses = [a for a in analyses if a.auto_fixable]
+                if result.status == "OK":
+                    return
                 
-                if filter_type:
-                    analyses = [a for a in analyses if a.error_type == filter_type]
+                # Apply filters in a single pass, skipping it when none are set
+                if auto_fixable_only or filter_type:
+                    analyses = [
+                        a for a in analyses
+                        if (not auto_fixable_only or a.auto_fixable)
+                        and (not filter_type or a.error_type == filter_type)
+                    ]
                 
                 if analyses:
                     files_to_format.append((result.filepath, analyses))
             
+            _scan_and_analyze(path, recursive, on_result, path_mode)
+            
             if not files_to_format:
                 console.print("[yellow]No files found that match the formatting criteria[/yellow]")
                 return
@@ -170,12 +204,10 @@ def format(path, recursive, auto_fixable_only, backup, dry_run, filter_type):
         format_files(formatter, files_to_format)
 
 
-@main.command()
-@click.option('--host', default='127.0.0.1', help='Host to bind to')
-@click.option('--port', default=8080, help='Port to bind to')
-@click.option('--debug', is_flag=True, help='Enable debug mode')
-def dashboard(host, port, debug):
+def dashboard(host='127.0.0.1', port=8080, debug=False):
     """Launch the web dashboard."""
+    from ..dashboard.app import create_app
+    
     console.print(f"[bold green]Starting dashboard at http://{host}:{port}[/bold green]")
     console.print("[dim]Press Ctrl+C to stop[/dim]")
     
@@ -189,18 +221,13 @@ def dashboard(host, port, debug):
         sys.exit(1)
 
 
-@main.command()
-@click.argument('path', type=click.Path(exists=True))
-@click.option('--output', '-o', type=click.Path(), help='Output file for report')
-@click.option('--format', 'report_format', type=click.Choice(['json', 'html', 'text']), 
-              default='text', help='Report format')
-@click.option('--include-recommendations', is_flag=True, help='Include recommendations in report')
-def report(path, output, report_format, include_recommendations):
+def report(path, output=None, report_format='text', include_recommendations=False, compact=False,
+           path_mode=None):
     """Generate a comprehensive report of norminette errors."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
     console.print(f"[bold cyan]Generating report for:[/bold cyan] {path}")
     
-    scanner = NorminetteScanner()
-    parser = ErrorParser()
     aggregator = FileAggregator()
     
     with Progress(
@@ -211,35 +238,27 @@ def report(path, output, report_format, include_recommendations):
         task = progress.add_task("Analyzing project...", total=None)
         
         try:
-            if os.path.isfile(path):
-                results = [scanner.scan_file(path)]
-            else:
-                results = scanner.scan_directory(path, recursive=True)
-            
-            for result in results:
-                analyses = []
-                if result.errors:
-                    analyses = parser.analyze_file_errors(result.errors)
+            def on_result(result, analyses):
                 aggregator.add_scan_result(result, analyses)
+                progress.update(task, description=f"Analyzing project... ({len(aggregator.files)} done)")
+            
+            _scan_and_analyze(path, True, on_result, path_mode)
             
         except Exception as e:
             console.print(f"[red]Error generating report: {e}[/red]")
             sys.exit(1)
     
-    # Generate report
-    report_data = aggregator.export_report(report_format)
-    
     if output:
-        save_report_to_file(report_data, output, report_format)
+        save_report_to_file(aggregator, output, report_format, compact)
         console.print(f"[green]Report saved to {output}[/green]")
     else:
         display_text_report(aggregator, include_recommendations)
 
 
-@main.command()
-@click.argument('filepath', type=click.Path(exists=True))
 def preview(filepath):
     """Preview what fixes would be applied to a file."""
+    from rich.panel import Panel
+    
     console.print(f"[bold magenta]Preview fixes for:[/bold magenta] {filepath}")
     
     scanner = NorminetteScanner()
@@ -277,8 +296,6 @@ def preview(filepath):
         sys.exit(1)
 
 
-@main.command()
-@click.argument('filepath', type=click.Path(exists=True))
 def restore(filepath):
     """Restore a file from backup."""
     console.print(f"[bold orange1]Restoring:[/bold orange1] {filepath}")
@@ -299,8 +316,113 @@ def restore(filepath):
         sys.exit(1)
 
 
+def _build_parser() -> Tuple[argparse.ArgumentParser, Dict[str, int]]:
+    """
+    Build the argument parser for all CLI commands.
+
+    Returns:
+        The parser, and the st_mode of every path it accepted, filled in while
+        parsing so the file/directory dispatch needs no second stat()
+    """
+    path_modes: Dict[str, int] = {}
+
+    def _existing_path(value: str) -> str:
+        """argparse type accepting only paths that exist."""
+        mode = _path_mode(value)
+        if mode is None:
+            raise argparse.ArgumentTypeError(f"Path '{value}' does not exist.")
+        path_modes[value] = mode
+        return value
+
+    parser = argparse.ArgumentParser(
+        prog='norminette-formatter',
+        description='42-Norminette-Formatter - A comprehensive tool for managing norminette errors.'
+    )
+    parser.add_argument('--version', action='version', version='%(prog)s, version 1.0.0')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    # scan
+    cmd = commands.add_parser('scan', help=scan.__doc__, description=scan.__doc__)
+    cmd.add_argument('path', type=_existing_path)
+    cmd.add_argument('--recursive', '-r', action='store_true', default=True, help='Scan directories recursively')
+    cmd.add_argument('--output', '-o', help='Output file for results (JSON format)')
+    cmd.add_argument('--filter-status', choices=['OK', 'Error', 'Warning', 'Critical'],
+                     help='Filter results by status')
+    cmd.add_argument('--filter-type', help='Filter results by error type')
+    cmd.add_argument('--show-details', action='store_true', help='Show detailed error information')
+    cmd.add_argument('--compact', action='store_true', help='Write compact (non-indented) JSON output')
+    cmd.set_defaults(handler=scan)
+
+    # format
+    cmd = commands.add_parser('format', help=format.__doc__, description=format.__doc__)
+    cmd.add_argument('path', type=_existing_path)
+    cmd.add_argument('--recursive', '-r', action='store_true', default=True, help='Process directories recursively')
+    cmd.add_argument('--auto-fixable-only', action='store_true', help='Only fix auto-fixable errors')
+    cmd.add_argument('--backup', dest='backup', action='store_true', default=True,
+                     help='Create backups before formatting (default)')
+    cmd.add_argument('--no-backup', dest='backup', action='store_false', help='Do not create backups')
+    cmd.add_argument('--dry-run', action='store_true', help='Show what would be fixed without making changes')
+    cmd.add_argument('--filter-type', help='Only fix specific error types')
+    cmd.set_defaults(handler=format)
+
+    # dashboard
+    cmd = commands.add_parser('dashboard', help=dashboard.__doc__, description=dashboard.__doc__)
+    cmd.add_argument('--host', default='127.0.0.1', help='Host to bind to')
+    cmd.add_argument('--port', type=int, default=8080, help='Port to bind to')
+    cmd.add_argument('--debug', action='store_true', help='Enable debug mode')
+    cmd.set_defaults(handler=dashboard)
+
+    # report
+    cmd = commands.add_parser('report', help=report.__doc__, description=report.__doc__)
+    cmd.add_argument('path', type=_existing_path)
+    cmd.add_argument('--output', '-o', help='Output file for report')
+    cmd.add_argument('--format', dest='report_format', choices=['json', 'html', 'text'],
+                     default='text', help='Report format')
+    cmd.add_argument('--include-recommendations', action='store_true', help='Include recommendations in report')
+    cmd.add_argument('--compact', action='store_true', help='Write compact (non-indented) JSON output')
+    cmd.set_defaults(handler=report)
+
+    # preview
+    cmd = commands.add_parser('preview', help=preview.__doc__, description=preview.__doc__)
+    cmd.add_argument('filepath', type=_existing_path)
+    cmd.set_defaults(handler=preview)
+
+    # restore
+    cmd = commands.add_parser('restore', help=restore.__doc__, description=restore.__doc__)
+    cmd.add_argument('filepath', type=_existing_path)
+    cmd.set_defaults(handler=restore)
+
+    return parser, path_modes
+
+
+def main(argv: Optional[List[str]] = None):
+    """42-Norminette-Formatter - A comprehensive tool for managing norminette errors."""
+    parser, path_modes = _build_parser()
+    args = vars(parser.parse_args(argv))
+
+    # Logging is only configured on request; warnings and errors still reach
+    # stderr through the logging module's last-resort handler.
+    if args.pop('verbose'):
+        logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        console.print("[dim]Verbose mode enabled[/dim]")
+
+    handler = args.pop('handler', None)
+    if handler is None:
+        parser.print_help()
+        return
+
+    del args['command']
+    if 'path' in args:
+        args['path_mode'] = path_modes[args['path']]
+    handler(**args)
+
+
 def display_scan_results(aggregator, summary, filter_status, filter_type, show_details):
     """Display scan results in a formatted table."""
+    from rich.panel import Panel
+    from rich.table import Table
+    
     # Summary panel
     summary_text = f"""
 Total Files: {summary.total_files}
@@ -316,13 +438,14 @@ Auto-fixable: {summary.auto_fixable_errors}
     # Files table
     files = aggregator.files
     
-    # Apply filters
-    if filter_status:
-        status_enum = FileStatus(filter_status)
-        files = [f for f in files if f.status == status_enum]
-    
-    if filter_type:
-        files = [f for f in files if filter_type in f.error_types]
+    # Apply filters in a single pass
+    if filter_status or filter_type:
+        status_enum = FileStatus(filter_status) if filter_status else None
+        files = [
+            f for f in files
+            if (status_enum is None or f.status is status_enum)
+            and (not filter_type or filter_type in f.error_types)
+        ]
     
     if not files:
         console.print("[yellow]No files match the specified filters[/yellow]")
@@ -338,16 +461,9 @@ Auto-fixable: {summary.auto_fixable_errors}
         table.add_column("Error Types", style="dim")
     
     for file_info in files:
-        status_style = {
-            FileStatus.OK: "green",
-            FileStatus.WARNING: "yellow",
-            FileStatus.ERROR: "red",
-            FileStatus.CRITICAL: "bold red"
-        }.get(file_info.status, "white")
-        
         row = [
             file_info.filename,
-            f"[{status_style}]{file_info.status.value}[/{status_style}]",
+            _STATUS_CELL[file_info.status],
             str(file_info.error_count),
             str(file_info.auto_fixable_count)
         ]
@@ -363,6 +479,8 @@ Auto-fixable: {summary.auto_fixable_errors}
 
 def display_dry_run_results(files_to_format):
     """Display what would be formatted in dry-run mode."""
+    from rich.table import Table
+    
     console.print(f"\n[bold]Dry run - would format {len(files_to_format)} files:[/bold]")
     
     table = Table(title="Files to Format")
@@ -371,9 +489,9 @@ def display_dry_run_results(files_to_format):
     table.add_column("Error Types", style="dim")
     
     for filepath, analyses in files_to_format:
-        filename = Path(filepath).name
+        filename = os.path.basename(filepath)
         error_count = len(analyses)
-        error_types = ", ".join(set(a.error_type for a in analyses))
+        error_types = ", ".join(dict.fromkeys(a.error_type for a in analyses))
         
         table.add_row(filename, str(error_count), error_types)
     
@@ -381,31 +499,33 @@ def display_dry_run_results(files_to_format):
 
 
 def format_files(formatter, files_to_format):
-    """Format the specified files."""
+    """Format the specified files (large batches in parallel, see AutoFormatter.format_multiple_files)."""
+    from rich.console import Group
+    
     total_changes = 0
     successful_files = 0
+    messages = []
+    
+    with console.status(f"Formatting {len(files_to_format)} files..."):
+        results = formatter.format_multiple_files(dict(files_to_format))
     
-    with Progress(console=console) as progress:
-        task = progress.add_task("Formatting files...", total=len(files_to_format))
+    for filepath, result in results.items():
+        filename = os.path.basename(filepath)
         
-        for filepath, analyses in files_to_format:
-            filename = Path(filepath).name
-            progress.update(task, description=f"Formatting {filename}...")
-            
-            try:
-                result = formatter.format_file(filepath, analyses)
-                
-                if result.success:
-                    total_changes += result.changes_made
-                    successful_files += 1
-                    console.print(f"[green]✓[/green] {filename}: {result.changes_made} changes")
-                else:
-                    console.print(f"[red]✗[/red] {filename}: {result.message}")
-                    
-            except Exception as e:
-                console.print(f"[red]✗[/red] {filename}: Error - {e}")
-            
-            progress.advance(task)
+        if result.success:
+            total_changes += result.changes_made
+            successful_files += 1
+            messages.append(f"[green]✓[/green] {filename}: {result.changes_made} changes")
+        else:
+            messages.append(f"[red]✗[/red] {filename}: {result.message}")
+        
+        # Render status lines in batches rather than one print per file
+        if len(messages) >= STATUS_BATCH_SIZE:
+            console.print(Group(*messages))
+            messages.clear()
+    
+    if messages:
+        console.print(Group(*messages))
     
     # Summary
     console.print(f"\n[bold]Formatting complete![/bold]")
@@ -413,20 +533,20 @@ def format_files(formatter, files_to_format):
     console.print(f"Total changes made: {total_changes}")
 
 
-def save_results_to_file(aggregator, output_path):
+def save_results_to_file(aggregator, output_path, compact=False):
     """Save scan results to a file."""
-    report_data = aggregator.export_report('json')
-    
-    with open(output_path, 'w') as f:
-        json.dump(report_data, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(aggregator.export_report_json(compact=compact))
 
 
-def save_report_to_file(report_data, output_path, report_format):
+def save_report_to_file(aggregator, output_path, report_format, compact=False):
     """Save report to file in specified format."""
     if report_format == 'json':
-        with open(output_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
-    elif report_format == 'html':
+        save_results_to_file(aggregator, output_path, compact)
+        return
+    
+    report_data = aggregator.export_report(report_format)
+    if report_format == 'html':
         # Generate HTML report (simplified)
         html_content = generate_html_report(report_data)
         with open(output_path, 'w') as f:
@@ -439,6 +559,8 @@ def save_report_to_file(report_data, output_path, report_format):
 
 def display_text_report(aggregator, include_recommendations):
     """Display a text report to console."""
+    from rich.panel import Panel
+    
     summary = aggregator.generate_project_summary()
     
     # Project overview
@@ -462,7 +584,7 @@ def display_text_report(aggregator, include_recommendations):
     
     # Recommendations
     if include_recommendations:
-        recommendations = aggregator.get_recommendations()
+        recommendations = aggregator.get_recommendations(summary)
         if recommendations:
             console.print("\n[bold]Recommendations:[/bold]")
             for rec in recommendations:
@@ -472,7 +594,7 @@ def display_text_report(aggregator, include_recommendations):
 def generate_html_report(report_data):
     """Generate HTML report content."""
     # Simplified HTML report generation
-    html = f"""
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -495,18 +617,17 @@ def generate_html_report(report_data):
         </div>
         <h2>Recommendations</h2>
         <ul>
-    """
+    """]
     
-    for rec in report_data.get('recommendations', []):
-        html += f"<li>{rec}</li>"
+    parts.extend(f"<li>{html_escape(rec)}</li>" for rec in report_data.get('recommendations', []))
     
-    html += """
+    parts.append("""
         </ul>
     </body>
     </html>
-    """
+    """)
     
-    return html
+    return ''.join(parts)
 
 
 def generate_text_report(report_data):
@@ -0,0 +1,104 @@
+/*
+ * Native line-of-code counter for the file aggregator.
+ *
+ * Mirrors aggregator._count_loc_py exactly: lines are split like
+ * bytes.splitlines (\n, \r\n, \r), trimmed of ASCII whitespace, and run
+ * through the same comment state machine.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static int
+is_space(unsigned char c)
+{
+    return c == ' ' || c == '\t' || c == '\n' || c == '\r' || c == '\v' || c == '\f';
+}
+
+static Py_ssize_t
+count_buffer(const unsigned char *p, Py_ssize_t n)
+{
+    Py_ssize_t i = 0;
+    Py_ssize_t loc = 0;
+    int in_comment = 0;
+
+    while (i < n) {
+        Py_ssize_t a = i;
+        Py_ssize_t b;
+        Py_ssize_t j;
+        int has_open = 0;
+        int has_close = 0;
+
+        while (i < n && p[i] != '\n' && p[i] != '\r')
+            i++;
+        b = i;
+        if (i < n) {
+            if (p[i] == '\r' && i + 1 < n && p[i + 1] == '\n')
+                i += 2;
+            else
+                i++;
+        }
+
+        while (a < b && is_space(p[a]))
+            a++;
+        while (b > a && is_space(p[b - 1]))
+            b--;
+        if (a == b)
+            continue;
+
+        for (j = a; j + 1 < b; j++) {
+            if (p[j] == '/' && p[j + 1] == '*')
+                has_open = 1;
+            else if (p[j] == '*' && p[j + 1] == '/')
+                has_close = 1;
+        }
+
+        if (has_open)
+            in_comment = 1;
+        if (has_close) {
+            in_comment = 0;
+            continue;
+        }
+        if (in_comment)
+            continue;
+        if (p[a] == '*' || (p[a] == '/' && a + 1 < b && p[a + 1] == '/'))
+            continue;
+        loc++;
+    }
+    return loc;
+}
+
+static PyObject *
+cloc_count(PyObject *module, PyObject *arg)
+{
+    Py_buffer view;
+    Py_ssize_t loc;
+
+    if (PyObject_GetBuffer(arg, &view, PyBUF_SIMPLE) < 0)
+        return NULL;
+    Py_BEGIN_ALLOW_THREADS
+    loc = count_buffer((const unsigned char *)view.buf, view.len);
+    Py_END_ALLOW_THREADS
+    PyBuffer_Release(&view);
+    return PyLong_FromSsize_t(loc);
+}
+
+static PyMethodDef cloc_methods[] = {
+    {"count", cloc_count, METH_O,
+     "count(data) -> int\n\nCount lines of code in a bytes-like C source buffer."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef cloc_module = {
+    PyModuleDef_HEAD_INIT,
+    "_cloc",
+    "Native line-of-code counter.",
+    -1,
+    cloc_methods
+};
+
+PyMODINIT_FUNC
+PyInit__cloc(void)
+{
+    return PyModule_Create(&cloc_module);
+}
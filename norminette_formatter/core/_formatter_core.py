@@ -0,0 +1,231 @@
+"""
+Formatter Kernels
+
+Line-scanning loops used by the AutoFormatter. This module is plain Python so
+it works everywhere; setup.py also compiles it with Cython when Cython is
+installed, and the compiled module is then imported in its place.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+_FUNC_CALL_RE = re.compile(r'(\w+\s*\()')
+_PARAM_SPECIAL_RE = re.compile(r'[(),]')
+
+# Leading whitespace of a non-blank line (newlines excluded)
+_LEADING_WHITESPACE_RE = re.compile(r'^[^\S\n]+(?=\S)', re.MULTILINE)
+
+# Tab prefixes for the indent depths real code reaches, built once
+_TABS = tuple('\t' * depth for depth in range(32))
+
+# Lexer states for scan_braces
+_CODE, _STRING, _CHAR, _BLOCK_COMMENT = range(4)
+
+# Characters that can change the brace count or the lexer state on a code line
+_BRACE_SIGNIFICANT = frozenset('{}"\'/')
+
+
+def scan_braces(lines: List[str]) -> List[Tuple[int, int]]:
+    """
+    Count the code braces on each line in one pass.
+
+    Braces inside string and character literals and comments are not counted.
+    Block comments carry over to the following lines; literals and // comments
+    end with their line.
+
+    Args:
+        lines: Source lines
+
+    Returns:
+        One (open_braces, close_braces) tuple per line
+    """
+    counts = []
+    state = _CODE
+
+    for line in lines:
+        if state == _BLOCK_COMMENT:
+            if '*/' not in line:
+                counts.append((0, 0))
+                continue
+        else:
+            state = _CODE
+            if _BRACE_SIGNIFICANT.isdisjoint(line):
+                counts.append((0, 0))
+                continue
+
+        opened = closed = 0
+        i = 0
+        n = len(line)
+        while i < n:
+            char = line[i]
+            if state == _CODE:
+                if char == '{':
+                    opened += 1
+                elif char == '}':
+                    closed += 1
+                elif char == '"':
+                    state = _STRING
+                elif char == "'":
+                    state = _CHAR
+                elif char == '/' and i + 1 < n:
+                    if line[i + 1] == '/':
+                        break
+                    if line[i + 1] == '*':
+                        state = _BLOCK_COMMENT
+                        i += 1
+            elif state == _BLOCK_COMMENT:
+                if char == '*' and i + 1 < n and line[i + 1] == '/':
+                    state = _CODE
+                    i += 1
+            elif char == '\\':
+                i += 1  # Skip the escaped character
+            elif char == ('"' if state == _STRING else "'"):
+                state = _CODE
+            i += 1
+
+        counts.append((opened, closed))
+
+    return counts
+
+
+def break_at_function_params(line: str, indent_str: str) -> str:
+    """Break long function calls at parameter boundaries."""
+    # Find function call pattern
+    match = _FUNC_CALL_RE.search(line)
+    if not match:
+        return line
+
+    func_start = match.end()
+    paren_count = 1
+    params_spans = []  # (start, end) of each parameter, sliced out once at the end
+    param_start = func_start
+
+    # Jump between parens and commas; nothing else affects the split
+    i = len(line)
+    for special in _PARAM_SPECIAL_RE.finditer(line, func_start):
+        char = special.group()
+        if char == '(':
+            paren_count += 1
+        elif char == ')':
+            paren_count -= 1
+            if paren_count == 0:
+                i = special.start()
+                params_spans.append((param_start, i))
+                break
+        elif paren_count == 1:
+            params_spans.append((param_start, special.start()))
+            param_start = special.end()
+
+    params = [line[s:e].strip() for s, e in params_spans]
+    if params and not params[-1] and paren_count == 0:
+        params.pop()  # An empty last parameter is dropped, as before
+
+    if len(params) > 1:
+        # Reconstruct with line breaks
+        return line[:func_start] + (',\n' + indent_str + '\t').join(params) + line[i:]
+
+    return line
+
+
+def fix_indentation(lines: List[str]) -> Tuple[Optional[List[str]], int]:
+    """Re-indent lines with tabs by brace depth; updates lines in place, None if unchanged."""
+    changes = 0
+    indent_level = 0
+
+    for i, (opened, closed) in enumerate(scan_braces(lines)):
+        line = lines[i]
+        if not line.strip():  # Skip empty lines
+            continue
+
+        # Calculate expected indent level
+        stripped = line.lstrip()
+
+        # Adjust indent level based on braces
+        if closed:
+            indent_level = max(0, indent_level - closed)
+
+        # Apply correct indentation
+        expected_indent = _TABS[indent_level] if indent_level < 32 else '\t' * indent_level
+        if not line.startswith(expected_indent) and line.strip():
+            lines[i] = expected_indent + stripped
+            changes += 1
+
+        # Update indent level for next line
+        indent_level += opened
+
+    return (lines if changes else None), changes
+
+
+def fix_empty_lines(lines: List[str]) -> Tuple[Optional[List[str]], int]:
+    """Drop empty lines inside functions, repeated and trailing; new list, None if unchanged."""
+    changes = 0
+    result_lines = []
+    in_function = False
+    brace_count = 0
+
+    for line, (opened, closed) in zip(lines, scan_braces(lines)):
+        stripped = line.strip()
+
+        # Track function boundaries
+        if opened:
+            brace_count += opened
+            if brace_count > 0:
+                in_function = True
+
+        if closed:
+            brace_count -= closed
+            if brace_count <= 0:
+                in_function = False
+                brace_count = 0
+
+        # Remove empty lines inside functions
+        if in_function and not stripped and brace_count > 0:
+            changes += 1
+            continue
+
+        # Handle consecutive newlines (keep only one)
+        if not stripped and result_lines and not result_lines[-1].strip():
+            changes += 1
+            continue
+
+        result_lines.append(line)
+
+    # Remove empty line at end of file
+    while result_lines and not result_lines[-1].strip():
+        result_lines.pop()
+        changes += 1
+
+    return (result_lines if changes else None), changes
+
+
+def _convert_leading_whitespace(whitespace: str) -> str:
+    """Tab-converted form of a line's leading whitespace (unchanged if already fine)."""
+    if '\t' in whitespace:
+        if ' ' not in whitespace:
+            return whitespace
+        # Mixed tabs and spaces: assume 4 spaces = 1 tab
+        depth = whitespace.count('\t') + whitespace.count(' ') // 4
+        return _TABS[depth] if depth < 32 else '\t' * depth
+
+    # Replace leading spaces with tabs (if more than 3 spaces)
+    if ' ' in whitespace and len(whitespace) >= 4:
+        depth = len(whitespace) // 4
+        return (_TABS[depth] if depth < 32 else '\t' * depth) + ' ' * (len(whitespace) % 4)
+    return whitespace
+
+
+def fix_tab_space_issues(content: str) -> Tuple[str, int]:
+    """Turn space and mixed indentation into tabs in one substitution over the content."""
+    changes = 0
+
+    def convert(match):
+        nonlocal changes
+        whitespace = match.group()
+        converted = _convert_leading_whitespace(whitespace)
+        if converted != whitespace:
+            changes += 1
+        return converted
+
+    # Lines that are blank are left alone, as the lookahead needs a non-space
+    content = _LEADING_WHITESPACE_RE.sub(convert, content)
+    return content, changes
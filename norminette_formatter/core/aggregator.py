@@ -5,16 +5,83 @@ This module provides functionality to aggregate and organize norminette scan res
 including file status categorization, filtering, and report generation.
 """
 
-from typing import List, Dict, Optional, Set, Tuple, Any
-from dataclasses import dataclass
+import bisect
+import fnmatch
+import heapq
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Iterable, FrozenSet, List, Dict, Optional, Set, Tuple, Any
+import sys
+import weakref
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 from pathlib import Path
 from .scanner import NorminetteResult
-from .parser import ErrorAnalysis, ErrorSeverity, FixComplexity
+from .parser import _VALUE_OBJECT, ErrorAnalysis, ErrorSeverity, FixComplexity
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Shared error-type sets: files with the same error types reuse one frozenset
+_ERROR_TYPE_SETS: 'weakref.WeakValueDictionary[FrozenSet[str], FrozenSet[str]]' = weakref.WeakValueDictionary()
+
+# Slot of each severity in the per-file and project severity histograms
+_SEVERITY_INDEX = {severity: i for i, severity in enumerate(
+    [ErrorSeverity.CRITICAL, ErrorSeverity.HIGH, ErrorSeverity.MEDIUM, ErrorSeverity.LOW])}
+_SEVERITY_NAMES = ('critical', 'high', 'medium', 'low')
+
+# Threads used to count lines of code for pending files
+FS_PROBE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _count_loc_py(data: bytes) -> int:
+    """Count lines of code in raw C source (excluding empty lines and comments)."""
+    loc = 0
+    in_multiline_comment = False
+    
+    # bytes.splitlines breaks on \n, \r\n and \r like text-mode reads
+    for line in data.splitlines():
+        stripped = line.strip()
+        
+        # Skip empty lines
+        if not stripped:
+            continue
+        
+        # Handle multi-line comments
+        if b'/*' in stripped:
+            in_multiline_comment = True
+        if b'*/' in stripped:
+            in_multiline_comment = False
+            continue
+        
+        if in_multiline_comment:
+            continue
+        
+        # Skip single-line comments
+        if stripped.startswith((b'//', b'*')):
+            continue
+        
+        loc += 1
+    
+    return loc
+
+
+# Native counter from the optional _cloc extension, same results as _count_loc_py
+try:
+    from ._cloc import count as _count_loc
+except ImportError:
+    _count_loc = _count_loc_py
+
 
 class FileStatus(Enum):
     """File status categories."""
@@ -24,24 +91,203 @@ class FileStatus(Enum):
     CRITICAL = "Critical"
 
 
-@dataclass
 class FileInfo:
-    """Information about a single file."""
-    filepath: str
-    filename: str
-    status: FileStatus
-    error_count: int
-    auto_fixable_count: int
-    critical_errors: int
-    high_errors: int
-    medium_errors: int
-    low_errors: int
-    error_types: Set[str]
-    lines_of_code: int
-    last_modified: float
-
-
-@dataclass
+    """
+    Information about a single file.
+    
+    lines_of_code and last_modified are read from disk on first access, so
+    code that only looks at statuses and errors never opens the file. Values
+    that are already known (e.g. an mtime from a DirEntry) can be passed in.
+    """
+    __slots__ = ('filepath', 'filename', 'status', 'error_count', 'auto_fixable_count',
+                 'critical_errors', 'high_errors', 'medium_errors', 'low_errors',
+                 'error_types', 'fix_score', 'search_blob', '_loc', '_mtime', '_problem_score')
+    
+    def __init__(self, filepath: str, filename: str, status: 'FileStatus', error_count: int,
+                 auto_fixable_count: int, critical_errors: int, high_errors: int,
+                 medium_errors: int, low_errors: int, error_types: FrozenSet[str],
+                 lines_of_code: Optional[int] = None, last_modified: Optional[float] = None,
+                 fix_score: float = 0.0, search_blob: str = ''):
+        self.filepath = filepath
+        self.filename = filename
+        self.status = status
+        self.error_count = error_count
+        self.auto_fixable_count = auto_fixable_count
+        self.critical_errors = critical_errors
+        self.high_errors = high_errors
+        self.medium_errors = medium_errors
+        self.low_errors = low_errors
+        self.error_types = error_types
+        self.fix_score = fix_score        # Ranking key for get_easiest_fixes
+        self.search_blob = search_blob    # Lowercased text matched by search_files
+        self._loc = lines_of_code
+        self._mtime = last_modified
+        self._problem_score: Optional[float] = None
+    
+    @property
+    def lines_of_code(self) -> int:
+        """Lines of code, counted on first access."""
+        if self._loc is None:
+            self._loc = _count_lines_of_code(self.filepath)
+        return self._loc
+    
+    @property
+    def last_modified(self) -> float:
+        """Modification timestamp, read on first access."""
+        if self._mtime is None:
+            self._mtime = _get_last_modified(self.filepath)
+        return self._mtime
+    
+    @property
+    def problem_score(self) -> float:
+        """Ranking key for get_most_problematic_files (needs lines_of_code)."""
+        if self._problem_score is None:
+            self._problem_score = _problem_score(self.critical_errors, self.high_errors,
+                                                 self.medium_errors, self.low_errors,
+                                                 self.error_count, self.lines_of_code)
+        return self._problem_score
+    
+    def _fields(self) -> tuple:
+        # The lazy disk-derived fields are left out (as in __hash__), so comparing never opens or stats the file
+        return (self.filepath, self.filename, self.status, self.error_count,
+                self.auto_fixable_count, self.critical_errors, self.high_errors,
+                self.medium_errors, self.low_errors, self.error_types, self.fix_score)
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    def __hash__(self):
+        return hash((self.filepath, self.status, self.error_count, self.error_types))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the per-file entry used in exported reports."""
+        return {
+            'filepath': self.filepath,
+            'filename': self.filename,
+            'status': self.status.value,
+            'error_count': self.error_count,
+            'auto_fixable_count': self.auto_fixable_count,
+            'critical_errors': self.critical_errors,
+            'high_errors': self.high_errors,
+            'medium_errors': self.medium_errors,
+            'low_errors': self.low_errors,
+            'error_types': list(self.error_types),
+            'lines_of_code': self.lines_of_code
+        }
+    
+    def __repr__(self):
+        return (f"FileInfo(filepath={self.filepath!r}, status={self.status}, "
+                f"error_count={self.error_count}, auto_fixable_count={self.auto_fixable_count}, "
+                f"error_types={self.error_types!r}, lines_of_code={self._loc!r}, "
+                f"last_modified={self._mtime!r})")
+
+
+def _file_info_default(obj: Any) -> Dict[str, Any]:
+    """JSON fallback serializer: turns FileInfo objects into their report entry."""
+    if isinstance(obj, FileInfo):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Any, compact: bool = False) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_file_info_default, option=option)
+    if compact:
+        return json.dumps(data, default=_file_info_default, separators=(',', ':'),
+                          ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, default=_file_info_default, indent=2).encode('utf-8')
+
+
+# filter_files clauses, in the order of the flags passed to _compile_file_filter
+_FILTER_CLAUSES = (
+    'f.status is status',
+    'error_type in f.error_types',
+    'f.error_count >= min_errors',
+    'f.error_count <= max_errors',
+    'f.auto_fixable_count > 0',
+    'pattern_re.match(f.filename.lower())',
+)
+
+
+@lru_cache(maxsize=None)
+def _compile_file_filter(active: Tuple[bool, ...]):
+    """
+    Generate a filter function that only evaluates the active clauses.
+    
+    Args:
+        active: One flag per entry of _FILTER_CLAUSES
+        
+    Returns:
+        Function (files, status, error_type, min_errors, max_errors, pattern_re) -> list
+    """
+    condition = ' and '.join(clause for clause, on in zip(_FILTER_CLAUSES, active) if on)
+    source = (
+        "def file_filter(files, status, error_type, min_errors, max_errors, pattern_re):\n"
+        f"    return [f for f in files{' if ' + condition if condition else ''}]\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, '<filter_files>', 'exec'), namespace)
+    return namespace['file_filter']
+
+
+def _count_lines_of_code(filepath: str) -> int:
+    """Count lines of code in a file (excluding empty lines and comments)."""
+    try:
+        # Work on raw bytes: no decoding and no per-line str objects
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        
+        return _count_loc(data)
+        
+    except Exception as e:
+        logger.warning(f"Failed to count lines in {filepath}: {e}")
+        return 0
+
+
+def _get_last_modified(filepath: str) -> float:
+    """Get last modified timestamp of a file."""
+    try:
+        return os.stat(filepath).st_mtime
+    except Exception:
+        return 0.0
+
+
+def _intern_error_types(error_types: Set[str]) -> FrozenSet[str]:
+    """Return a shared frozenset equal to error_types."""
+    frozen = frozenset(error_types)
+    return _ERROR_TYPE_SETS.setdefault(frozen, frozen)
+
+def _problem_score(critical_errors: int, high_errors: int, medium_errors: int, low_errors: int,
+                   error_count: int, lines_of_code: int) -> float:
+    """Calculate a problem score for ranking files."""
+    score = 0
+    score += critical_errors * 10
+    score += high_errors * 5
+    score += medium_errors * 2
+    score += low_errors * 1
+    
+    # Bonus for files with many errors relative to size
+    if lines_of_code > 0:
+        error_density = error_count / lines_of_code
+        score += error_density * 50
+    
+    return score
+
+
+def _fix_score(error_count: int, auto_fixable_count: int) -> float:
+    """Calculate fix score (higher = easier to fix)."""
+    if error_count == 0:
+        return 0
+    
+    auto_fix_ratio = auto_fixable_count / error_count
+    return auto_fix_ratio * auto_fixable_count
+
+
+@dataclass(**_VALUE_OBJECT)
 class ProjectSummary:
     """Summary statistics for the entire project."""
     total_files: int
@@ -53,9 +299,9 @@ class ProjectSummary:
     auto_fixable_errors: int
     total_lines_of_code: int
     success_rate: float
-    most_common_errors: List[Tuple[str, int]]
-    error_distribution: Dict[str, int]
-    severity_distribution: Dict[str, int]
+    most_common_errors: List[Tuple[str, int]] = field(hash=False)
+    error_distribution: Dict[str, int] = field(hash=False)
+    severity_distribution: Dict[str, int] = field(hash=False)
 
 
 class FileAggregator:
@@ -72,74 +318,135 @@ class FileAggregator:
     def __init__(self):
         """Initialize the file aggregator."""
         self.files: List[FileInfo] = []
+        self._file_index: Dict[str, int] = {}  # filepath -> position in self.files
+        # (error_count, position, FileInfo), kept sorted for error-count range filters
+        self._by_error_count: List[Tuple[int, int, FileInfo]] = []
         self.scan_results: Dict[str, NorminetteResult] = {}
         self.error_analyses: Dict[str, List[ErrorAnalysis]] = {}
         
-    def add_scan_result(self, result: NorminetteResult, analyses: List[ErrorAnalysis] = None):
+        # Running project totals, kept up to date as files are added or replaced
+        self._status_counts: Dict[FileStatus, int] = {status: 0 for status in FileStatus}
+        self._total_errors = 0
+        self._total_auto_fixable = 0
+        self._severity_counts: List[int] = [0, 0, 0, 0]  # Indexed by _SEVERITY_INDEX
+        self._error_type_counts: Counter = Counter()
+        
+        # Derived reports, rebuilt only after new scan results are added
+        self._summary_cache: Optional[ProjectSummary] = None
+        self._recommendations_cache: Optional[List[str]] = None
+        
+    def add_scan_result(self, result: NorminetteResult, analyses: List[ErrorAnalysis] = None,
+                        stat_result: Optional[os.stat_result] = None):
         """
         Add a scan result to the aggregator.
         
         Args:
             result: NorminetteResult from scanner
             analyses: Optional list of ErrorAnalysis objects
+            stat_result: Optional stat of the file, e.g. from a DirEntry, to avoid another stat() call
+        """
+        last_modified = stat_result.st_mtime if stat_result is not None else None
+        self._store_result(result, analyses, last_modified)
+    
+    def add_scan_results(self, results: Iterable[NorminetteResult],
+                         analyses_map: Optional[Dict[str, List[ErrorAnalysis]]] = None):
         """
+        Add many scan results at once.
+        
+        Args:
+            results: NorminetteResult objects from scanner
+            analyses_map: Optional mapping of filepath to ErrorAnalysis objects
+        """
+        analyses_map = analyses_map or {}
+        
+        for result in results:
+            self._store_result(result, analyses_map.get(result.filepath))
+    
+    def _store_result(self, result: NorminetteResult, analyses: Optional[List[ErrorAnalysis]],
+                      last_modified: Optional[float] = None):
+        """Record a scan result and its FileInfo, replacing any previous entry."""
         self.scan_results[result.filepath] = result
         if analyses:
             self.error_analyses[result.filepath] = analyses
         
         # Create FileInfo
-        file_info = self._create_file_info(result, analyses or [])
+        file_info = self._create_file_info(result, analyses or [], last_modified=last_modified)
         
         # Update or add file info
-        existing_index = None
-        for i, existing_file in enumerate(self.files):
-            if existing_file.filepath == result.filepath:
-                existing_index = i
-                break
+        existing_index = self._file_index.get(result.filepath)
         
         if existing_index is not None:
+            old_info = self.files[existing_index]
+            self._update_totals(old_info, -1)
+            by_error_count = self._by_error_count
+            del by_error_count[bisect.bisect_left(by_error_count, (old_info.error_count, existing_index))]
             self.files[existing_index] = file_info
         else:
+            existing_index = self._file_index[result.filepath] = len(self.files)
             self.files.append(file_info)
+        
+        bisect.insort(self._by_error_count, (file_info.error_count, existing_index, file_info))
+        self._update_totals(file_info, 1)
+        self._summary_cache = None
+        self._recommendations_cache = None
     
-    def _create_file_info(self, result: NorminetteResult, analyses: List[ErrorAnalysis]) -> FileInfo:
-        """Create FileInfo from scan result and analyses."""
+    def _update_totals(self, file_info: FileInfo, sign: int):
+        """Add (sign=1) or remove (sign=-1) a file's contribution to the running totals."""
+        self._status_counts[file_info.status] += sign
+        self._total_errors += sign * file_info.error_count
+        self._total_auto_fixable += sign * file_info.auto_fixable_count
+        
+        severity_counts = self._severity_counts
+        severity_counts[0] += sign * file_info.critical_errors
+        severity_counts[1] += sign * file_info.high_errors
+        severity_counts[2] += sign * file_info.medium_errors
+        severity_counts[3] += sign * file_info.low_errors
+        
+        if sign > 0:
+            self._error_type_counts.update(file_info.error_types)
+        else:
+            error_type_counts = self._error_type_counts
+            for error_type in file_info.error_types:
+                error_type_counts[error_type] -= 1
+                if not error_type_counts[error_type]:
+                    del error_type_counts[error_type]
+    
+    def _create_file_info(self, result: NorminetteResult, analyses: List[ErrorAnalysis],
+                          lines_of_code: Optional[int] = None,
+                          last_modified: Optional[float] = None) -> FileInfo:
+        """
+        Create FileInfo from scan result and analyses.
+        
+        File stats not supplied here are read lazily by FileInfo.
+        """
         filepath = result.filepath
         filename = Path(filepath).name
         
+        # Count errors by severity, auto-fixable errors and error types in one pass
+        severity_counts = [0, 0, 0, 0]
+        severity_index = _SEVERITY_INDEX
+        auto_fixable_count = 0
+        error_types = set()
+        
+        for a in analyses:
+            severity_counts[severity_index[a.severity]] += 1
+            if a.auto_fixable:
+                auto_fixable_count += 1
+            error_types.add(a.error_type)
+        
+        critical_errors, high_errors, medium_errors, low_errors = severity_counts
+        
         # Determine file status
         if result.status == "OK":
             status = FileStatus.OK
+        elif not analyses:
+            status = FileStatus.ERROR
+        elif critical_errors > 0:
+            status = FileStatus.CRITICAL
+        elif high_errors > 0:
+            status = FileStatus.ERROR
         else:
-            # Determine severity based on error analyses
-            if analyses:
-                critical_count = sum(1 for a in analyses if a.severity == ErrorSeverity.CRITICAL)
-                high_count = sum(1 for a in analyses if a.severity == ErrorSeverity.HIGH)
-                
-                if critical_count > 0:
-                    status = FileStatus.CRITICAL
-                elif high_count > 0:
-                    status = FileStatus.ERROR
-                else:
-                    status = FileStatus.WARNING
-            else:
-                status = FileStatus.ERROR
-        
-        # Count errors by severity
-        critical_errors = sum(1 for a in analyses if a.severity == ErrorSeverity.CRITICAL)
-        high_errors = sum(1 for a in analyses if a.severity == ErrorSeverity.HIGH)
-        medium_errors = sum(1 for a in analyses if a.severity == ErrorSeverity.MEDIUM)
-        low_errors = sum(1 for a in analyses if a.severity == ErrorSeverity.LOW)
-        
-        # Count auto-fixable errors
-        auto_fixable_count = sum(1 for a in analyses if a.auto_fixable)
-        
-        # Get error types
-        error_types = set(a.error_type for a in analyses)
-        
-        # Get file stats
-        lines_of_code = self._count_lines_of_code(filepath)
-        last_modified = self._get_last_modified(filepath)
+            status = FileStatus.WARNING
         
         return FileInfo(
             filepath=filepath,
@@ -151,56 +458,14 @@ class FileAggregator:
             high_errors=high_errors,
             medium_errors=medium_errors,
             low_errors=low_errors,
-            error_types=error_types,
+            error_types=_intern_error_types(error_types),
             lines_of_code=lines_of_code,
-            last_modified=last_modified
+            last_modified=last_modified,
+            fix_score=_fix_score(result.error_count, auto_fixable_count),
+            # The filename is the tail of the filepath, so the path covers both
+            search_blob='\0'.join([filepath, *error_types]).lower()
         )
     
-    def _count_lines_of_code(self, filepath: str) -> int:
-        """Count lines of code in a file (excluding empty lines and comments)."""
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            loc = 0
-            in_multiline_comment = False
-            
-            for line in lines:
-                stripped = line.strip()
-                
-                # Skip empty lines
-                if not stripped:
-                    continue
-                
-                # Handle multi-line comments
-                if '/*' in stripped:
-                    in_multiline_comment = True
-                if '*/' in stripped:
-                    in_multiline_comment = False
-                    continue
-                
-                if in_multiline_comment:
-                    continue
-                
-                # Skip single-line comments
-                if stripped.startswith('//') or stripped.startswith('*'):
-                    continue
-                
-                loc += 1
-            
-            return loc
-            
-        except Exception as e:
-            logger.warning(f"Failed to count lines in {filepath}: {e}")
-            return 0
-    
-    def _get_last_modified(self, filepath: str) -> float:
-        """Get last modified timestamp of a file."""
-        try:
-            return Path(filepath).stat().st_mtime
-        except Exception:
-            return 0.0
-    
     def filter_files(self, 
                     status: Optional[FileStatus] = None,
                     error_type: Optional[str] = None,
@@ -222,33 +487,22 @@ class FileAggregator:
         Returns:
             List of filtered FileInfo objects
         """
-        filtered = self.files
-        
-        # Filter by status
-        if status:
-            filtered = [f for f in filtered if f.status == status]
-        
-        # Filter by error type
-        if error_type:
-            filtered = [f for f in filtered if error_type in f.error_types]
-        
-        # Filter by error count range
-        if min_errors is not None:
-            filtered = [f for f in filtered if f.error_count >= min_errors]
-        
-        if max_errors is not None:
-            filtered = [f for f in filtered if f.error_count <= max_errors]
-        
-        # Filter by auto-fixable errors
-        if auto_fixable_only:
-            filtered = [f for f in filtered if f.auto_fixable_count > 0]
-        
-        # Filter by filename pattern
-        if filename_pattern:
-            import fnmatch
-            filtered = [f for f in filtered if fnmatch.fnmatch(f.filename.lower(), filename_pattern.lower())]
-        
-        return filtered
+        # Compile the filename pattern once instead of per file
+        pattern_re = re.compile(fnmatch.translate(filename_pattern.lower())) if filename_pattern else None
+        
+        files = self.files
+        has_range = min_errors is not None or max_errors is not None
+        if has_range:
+            # Slice the error-count index to the range, then restore file order
+            by_error_count = self._by_error_count
+            lo = 0 if min_errors is None else bisect.bisect_left(by_error_count, (min_errors,))
+            hi = len(by_error_count) if max_errors is None else bisect.bisect_right(by_error_count, (max_errors, sys.maxsize))
+            files = [entry[2] for entry in sorted(by_error_count[lo:hi], key=itemgetter(1))]
+        
+        # Single pass through a filter generated for the remaining criteria
+        file_filter = _compile_file_filter((bool(status), bool(error_type), False, False,
+                                            bool(auto_fixable_only), pattern_re is not None))
+        return file_filter(files, status, error_type, min_errors, max_errors, pattern_re)
     
     def get_files_by_status(self) -> Dict[FileStatus, List[FileInfo]]:
         """Group files by their status."""
@@ -261,15 +515,13 @@ class FileAggregator:
     
     def get_files_by_error_type(self) -> Dict[str, List[FileInfo]]:
         """Group files by error types."""
-        groups = {}
+        groups = defaultdict(list)
         
         for file_info in self.files:
             for error_type in file_info.error_types:
-                if error_type not in groups:
-                    groups[error_type] = []
                 groups[error_type].append(file_info)
         
-        return groups
+        return dict(groups)
     
     def get_most_problematic_files(self, limit: int = 10) -> List[FileInfo]:
         """
@@ -281,23 +533,8 @@ class FileAggregator:
         Returns:
             List of FileInfo objects sorted by problem severity
         """
-        def problem_score(file_info: FileInfo) -> float:
-            """Calculate a problem score for ranking files."""
-            score = 0
-            score += file_info.critical_errors * 10
-            score += file_info.high_errors * 5
-            score += file_info.medium_errors * 2
-            score += file_info.low_errors * 1
-            
-            # Bonus for files with many errors relative to size
-            if file_info.lines_of_code > 0:
-                error_density = file_info.error_count / file_info.lines_of_code
-                score += error_density * 50
-            
-            return score
-        
-        sorted_files = sorted(self.files, key=problem_score, reverse=True)
-        return sorted_files[:limit]
+        self._load_lines_of_code(self.files)
+        return heapq.nlargest(limit, self.files, key=attrgetter('problem_score'))
     
     def get_easiest_fixes(self, limit: int = 10) -> List[FileInfo]:
         """
@@ -309,20 +546,17 @@ class FileAggregator:
         Returns:
             List of FileInfo objects with highest auto-fixable ratios
         """
-        def fix_score(file_info: FileInfo) -> float:
-            """Calculate fix score (higher = easier to fix)."""
-            if file_info.error_count == 0:
-                return 0
-            
-            auto_fix_ratio = file_info.auto_fixable_count / file_info.error_count
-            return auto_fix_ratio * file_info.auto_fixable_count
-        
         fixable_files = [f for f in self.files if f.auto_fixable_count > 0]
-        sorted_files = sorted(fixable_files, key=fix_score, reverse=True)
-        return sorted_files[:limit]
+        return heapq.nlargest(limit, fixable_files, key=attrgetter('fix_score'))
     
     def generate_project_summary(self) -> ProjectSummary:
         """Generate comprehensive project summary."""
+        if self._summary_cache is None:
+            self._summary_cache = self._build_project_summary()
+        return self._summary_cache
+    
+    def _build_project_summary(self) -> ProjectSummary:
+        """Compute the project summary from the current files."""
         if not self.files:
             return ProjectSummary(
                 total_files=0, ok_files=0, error_files=0, warning_files=0,
@@ -331,37 +565,24 @@ class FileAggregator:
                 error_distribution={}, severity_distribution={}
             )
         
-        # Basic counts
+        # Totals are maintained incrementally by add_scan_result
         total_files = len(self.files)
-        status_counts = {status: 0 for status in FileStatus}
-        
-        for file_info in self.files:
-            status_counts[file_info.status] += 1
-        
-        # Error statistics
-        total_errors = sum(f.error_count for f in self.files)
-        auto_fixable_errors = sum(f.auto_fixable_count for f in self.files)
+        status_counts = self._status_counts
+        total_errors = self._total_errors
+        auto_fixable_errors = self._total_auto_fixable
+        # Line counts are lazy, so they are summed here rather than kept running
+        self._load_lines_of_code(self.files)
         total_lines_of_code = sum(f.lines_of_code for f in self.files)
+        error_type_counts = dict(self._error_type_counts)
         
         # Success rate
         success_rate = (status_counts[FileStatus.OK] / total_files * 100) if total_files > 0 else 0
         
-        # Error type distribution
-        error_type_counts = {}
-        for file_info in self.files:
-            for error_type in file_info.error_types:
-                error_type_counts[error_type] = error_type_counts.get(error_type, 0) + 1
-        
         # Most common errors
-        most_common_errors = sorted(error_type_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        most_common_errors = self._error_type_counts.most_common(10)
         
         # Severity distribution
-        severity_distribution = {
-            'critical': sum(f.critical_errors for f in self.files),
-            'high': sum(f.high_errors for f in self.files),
-            'medium': sum(f.medium_errors for f in self.files),
-            'low': sum(f.low_errors for f in self.files)
-        }
+        severity_distribution = dict(zip(_SEVERITY_NAMES, self._severity_counts))
         
         return ProjectSummary(
             total_files=total_files,
@@ -378,10 +599,33 @@ class FileAggregator:
             severity_distribution=severity_distribution
         )
     
-    def get_recommendations(self) -> List[str]:
-        """Generate recommendations based on project analysis."""
+    def _load_lines_of_code(self, files: List[FileInfo]):
+        """Count lines for files that have not been read yet, in a thread pool (I/O bound)."""
+        pending = [f for f in files if f._loc is None]
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(FS_PROBE_WORKERS, len(pending))) as executor:
+                list(executor.map(attrgetter('lines_of_code'), pending))
+    
+    def get_recommendations(self, summary: Optional[ProjectSummary] = None) -> List[str]:
+        """
+        Generate recommendations based on project analysis.
+        
+        Args:
+            summary: Previously generated project summary to reuse
+            
+        Returns:
+            List of recommendation strings
+        """
+        if summary is not None and summary is not self._summary_cache:
+            return self._build_recommendations(summary)
+        
+        if self._recommendations_cache is None:
+            self._recommendations_cache = self._build_recommendations(self.generate_project_summary())
+        return list(self._recommendations_cache)
+    
+    def _build_recommendations(self, summary: ProjectSummary) -> List[str]:
+        """Compute recommendations from a project summary."""
         recommendations = []
-        summary = self.generate_project_summary()
         
         # Success rate recommendations
         if summary.success_rate < 50:
@@ -416,37 +660,42 @@ class FileAggregator:
         
         return recommendations
     
-    def export_report(self, format: str = "json") -> Dict[str, Any]:
+    def export_report(self, format: str = "json", summary: Optional[ProjectSummary] = None) -> Dict[str, Any]:
         """
         Export comprehensive report in specified format.
         
         Args:
             format: Export format ("json", "csv", "html")
+            summary: Previously generated project summary to reuse
             
         Returns:
             Report data as dictionary
         """
-        summary = self.generate_project_summary()
-        recommendations = self.get_recommendations()
+        return self._build_report([file_info.to_dict() for file_info in self.files], summary)
+    
+    def export_report_json(self, summary: Optional[ProjectSummary] = None, compact: bool = False) -> bytes:
+        """
+        Export the JSON report as serialized bytes.
         
-        # Prepare file details
-        file_details = []
-        for file_info in self.files:
-            file_details.append({
-                'filepath': file_info.filepath,
-                'filename': file_info.filename,
-                'status': file_info.status.value,
-                'error_count': file_info.error_count,
-                'auto_fixable_count': file_info.auto_fixable_count,
-                'critical_errors': file_info.critical_errors,
-                'high_errors': file_info.high_errors,
-                'medium_errors': file_info.medium_errors,
-                'low_errors': file_info.low_errors,
-                'error_types': list(file_info.error_types),
-                'lines_of_code': file_info.lines_of_code
-            })
-        
-        report = {
+        FileInfo objects are handed to the serializer as they are, so no
+        intermediate per-file dicts are kept for the whole report.
+        
+        Args:
+            summary: Previously generated project summary to reuse
+            compact: Drop indentation from the output
+            
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return _dump_json(self._build_report(self.files, summary), compact)
+    
+    def _build_report(self, file_details: List[Any], summary: Optional[ProjectSummary]) -> Dict[str, Any]:
+        """Assemble the report tree around the given per-file entries."""
+        if summary is None:
+            summary = self.generate_project_summary()
+        recommendations = self.get_recommendations(summary)
+        
+        return {
             'summary': {
                 'total_files': summary.total_files,
                 'ok_files': summary.ok_files,
@@ -480,8 +729,6 @@ class FileAggregator:
                 for f in self.get_easiest_fixes(10)
             ]
         }
-        
-        return report
     
     def search_files(self, query: str) -> List[FileInfo]:
         """
@@ -494,29 +741,20 @@ class FileAggregator:
             List of matching FileInfo objects
         """
         query_lower = query.lower()
-        matches = []
+        return [f for f in self.files if query_lower in f.search_blob]
+    
+    def get_statistics(self, summary: Optional[ProjectSummary] = None) -> Dict[str, Any]:
+        """
+        Get detailed statistics for dashboard display.
         
-        for file_info in self.files:
-            # Search in filename
-            if query_lower in file_info.filename.lower():
-                matches.append(file_info)
-                continue
-            
-            # Search in filepath
-            if query_lower in file_info.filepath.lower():
-                matches.append(file_info)
-                continue
+        Args:
+            summary: Previously generated project summary to reuse
             
-            # Search in error types
-            if any(query_lower in error_type.lower() for error_type in file_info.error_types):
-                matches.append(file_info)
-                continue
-        
-        return matches
-    
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get detailed statistics for dashboard display."""
-        summary = self.generate_project_summary()
+        Returns:
+            Dictionary of statistics
+        """
+        if summary is None:
+            summary = self.generate_project_summary()
         
         return {
             'overview': {
@@ -8,28 +8,153 @@ code transformation functions.
 
 import re
 import os
-from typing import List, Dict, Optional, Tuple, Set
+import shutil
+import stat
+import string
+import tempfile
+import datetime
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, FrozenSet, Optional, Tuple, Set
 from pathlib import Path
 import logging
 from .parser import ErrorAnalysis, FixComplexity
+from ._formatter_core import break_at_function_params, fix_empty_lines, fix_indentation, fix_tab_space_issues
+
+try:
+    import regex
+except ImportError:
+    regex = None
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the fixers, compiled once at import time
+_KEYWORD_RE = re.compile(r'\b(if|while|for|switch|return)\(')
+_OPERATOR_SUBS = tuple(
+    (op, re.compile(rf'(\w){re.escape(op)}(\w)'), rf'\1 {op} \2')
+    for op in ('=', '==', '!=', '<=', '>=', '<', '>', '+', '-', '*', '/', '%')
+)
+# Finds every operator squeezed between word characters in one scan, longest first
+_OPERATOR_RE = re.compile(r'(?<=\w)(==|!=|<=|>=|[=<>+\-*/%])(?=\w)')
+_FUNC_SPACE_RE = re.compile(r'\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+_COMMA_RE = re.compile(r',(\S)')
+_SEMICOLON_RE = re.compile(r';(\S)')
+if regex is not None:
+    # Recursive group: the condition may nest parentheses to any depth
+    _BRACE_OPEN_RE = regex.compile(r'(if|while|for|else)\s*(\((?:[^()]|(?2))*\))\s*\n\s*{', regex.MULTILINE)
+else:
+    # The re module has no recursion; unroll the condition to a fixed nesting depth
+    _PARENS = r'\([^()]*\)'
+    for _ in range(3):
+        _PARENS = rf'\((?:[^()]|{_PARENS})*\)'
+    _BRACE_OPEN_RE = re.compile(rf'(if|while|for|else)\s*{_PARENS}\s*\n\s*{{', re.MULTILINE)
+    del _PARENS
+_BRACE_CLOSE_RE = re.compile(r';\s*}')
+_BRACE_AFTER_RE = re.compile(r'{\s*([^\n}])')
+_LONG_LINE_RE = re.compile(r'^[^\n]{81,}', re.MULTILINE)
+
+# Fixers after the header, in application order: (triggering rules, method, works on lines).
+# Line fixers take a list of lines and return None when nothing changed, the
+# others take and return the whole content.
+_FIX_PIPELINE = (
+    (('SPACE_BEFORE_FUNC', 'SPACE_AFTER_KW'), '_fix_spacing', False),
+    (('INDENT_BRANCH', 'INDENT_MULT_BRANCH'), '_fix_indentation_on_lines', True),
+    (('BRACE_NEWLINE', 'BRACE_SHOULD_EOL'), '_fix_braces', False),
+    (('SPACE_REPLACE_TAB', 'TAB_REPLACE_SPACE'), '_fix_tab_space_issues', False),
+    (('WRONG_SCOPE_COMMENT',), '_fix_comments_on_lines', True),
+    (('EMPTY_LINE_FUNCTION', 'EMPTY_LINE_EOF', 'CONSECUTIVE_NEWLINES'), '_fix_empty_lines_on_lines', True),
+    (('NEWLINE_PRECEDES_FUNC',), '_fix_function_spacing_on_lines', True),
+    # Line length goes last as it might affect other fixes
+    (('TOO_LONG_LINE',), '_fix_line_length_on_lines', True),
+)
+
+# format_multiple_files hands batches at least this large to a process pool
+PARALLEL_FORMAT_MIN_FILES = 16
+
+# Rule -> fixer stage it triggers ('_add_header' or a _FIX_PIPELINE method)
+_RULE_TO_STAGE = {rule: fixer_name for rules, fixer_name, _ in _FIX_PIPELINE for rule in rules}
+_RULE_TO_STAGE['HEADER_MISSING'] = '_add_header'
+
+
+def _fix_stages(error_analyses: List[ErrorAnalysis]) -> Optional[FrozenSet[str]]:
+    """Return the fixer stages triggered by the auto-fixable errors, None if there are none."""
+    rule_to_stage = _RULE_TO_STAGE
+    stages = set()
+    any_fixable = False
+    for analysis in error_analyses:
+        if analysis.auto_fixable:
+            any_fixable = True
+            stage = rule_to_stage.get(analysis.rule)
+            if stage is not None:
+                stages.add(stage)
+    return frozenset(stages) if any_fixable else None
+
 
 class FormatResult:
-    """Result of a formatting operation."""
+    """
+    Result of a formatting operation.
+
+    File contents are not kept by default: original_content and
+    formatted_content are read back on access, the original from the backup
+    (or the unchanged file) and the formatted content from the file itself.
+    Contents passed to the constructor are kept and returned as they are.
+    """
 
-    def __init__(self, success: bool, message: str, changes_made: int = 0, original_content: str = "", formatted_content: str = ""):
+    def __init__(self, success: bool, message: str, changes_made: int = 0,
+                 original_content: Optional[str] = None, formatted_content: Optional[str] = None,
+                 filepath: Optional[str] = None, backup_path: Optional[str] = None):
         self.success = success
         self.message = message
         self.changes_made = changes_made
-        self.original_content = original_content
-        self.formatted_content = formatted_content
+        self.filepath = filepath
+        self.backup_path = backup_path
+        self._original_content = original_content
+        self._formatted_content = formatted_content
+
+    @property
+    def original_content(self) -> str:
+        """Content before formatting."""
+        if self._original_content is not None:
+            return self._original_content
+        return self._read(self.backup_path if self.changes_made else self.filepath)
+
+    @property
+    def formatted_content(self) -> str:
+        """Content after formatting."""
+        if self._formatted_content is not None:
+            return self._formatted_content
+        return self._read(self.filepath if self.success else None)
+
+    @staticmethod
+    def _read(path: Optional[str]) -> str:
+        if path is None:
+            return ""
+        try:
+            with open(path, 'rb') as f:
+                return f.read().decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        except (OSError, UnicodeDecodeError):
+            return ""
 
     def __repr__(self):
         return f"FormatResult(success={self.success}, changes={self.changes_made}, message='{self.message}')"
 
 
+# Copy of the calling formatter in each format_multiple_files pool worker
+_worker_formatter: Optional['AutoFormatter'] = None
+
+
+def _init_format_worker(formatter: 'AutoFormatter') -> None:
+    """Process pool initializer: keep the caller's formatter for _format_one."""
+    global _worker_formatter
+    _worker_formatter = formatter
+
+
+def _format_one(job: Tuple[str, List[ErrorAnalysis]]) -> Tuple[str, 'FormatResult']:
+    """Process pool worker: format one file with the copy of the caller's formatter."""
+    filepath, analyses = job
+    return filepath, _worker_formatter._format_file_isolated(filepath, analyses)
+
+
 class AutoFormatter:
     """
     Automatic formatter for norminette errors.
@@ -42,16 +167,25 @@ class AutoFormatter:
     - Safe backup and restore functionality
     """
 
-    def __init__(self, backup_enabled: bool = True):
+    def __init__(self, backup_enabled: bool = True, keep_content: bool = False):
         """
         Initialize the auto formatter.
 
         Args:
             backup_enabled: Whether to create backups before formatting
+            keep_content: Keep original and formatted contents in FormatResult objects
+                instead of reading them back from disk when asked for
         """
         self.backup_enabled = backup_enabled
+        self.keep_content = keep_content
         self.backup_dir = ".norminette_backups"
         self.header_template = self._get_42_header_template()
+        # header_template and its (literal, field, format_spec, conversion) segments, parsed once per template
+        self._header_parts = (self.header_template, list(string.Formatter().parse(self.header_template)))
+        self._batch_time: Optional[datetime.datetime] = None  # Shared by a format_multiple_files run
+        self._backup_dir_ready: Optional[str] = None  # backup_dir once it is known to exist
+        # filepath -> (input content, stages, (content, changes)) of the last fix run
+        self._fix_cache: Dict[str, Tuple[str, FrozenSet[str], Tuple[str, int]]] = {}
 
     def _get_42_header_template(self) -> str:
         """Get the standard 42 header template."""
@@ -69,51 +203,91 @@ class AutoFormatter:
 
 """
 
+    def _now(self) -> datetime.datetime:
+        """Current time, or the shared time of the running format_multiple_files batch."""
+        return self._batch_time if self._batch_time is not None else datetime.datetime.now()
+
     def _create_backup(self, filepath: str) -> bool:
         """Create a backup of the file before formatting."""
+        return self._backup_file(filepath)[0]
+
+    def _backup_file(self, filepath: str) -> Tuple[bool, Optional[str]]:
+        """Back up a file; returns (success, absolute backup path or None when backups are off)."""
         if not self.backup_enabled:
-            return True
+            return True, None
 
         try:
-            # Create backup directory if it doesn't exist
+            # Create backup directory if it doesn't exist (checked once per directory)
             backup_path = Path(self.backup_dir)
-            backup_path.mkdir(exist_ok=True)
-
-            # Create backup filename with timestamp
-            import datetime
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = Path(filepath).name
-            backup_filename = f"{filename}.{timestamp}.backup"
+            if self._backup_dir_ready != self.backup_dir:
+                backup_path.mkdir(exist_ok=True)
+                self._backup_dir_ready = self.backup_dir
+
+            # Create backup filename with timestamp; the path tag keeps same-named files apart.
+            # Each backup takes its own time (not the batch's), down to microseconds.
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            backup_filename = f"{self._backup_prefix(filepath)}{timestamp}.backup"
             backup_filepath = backup_path / backup_filename
 
             # Copy original file to backup
-            import shutil
             shutil.copy2(filepath, backup_filepath)
 
             logger.info(f"Created backup: {backup_filepath}")
-            return True
+            return True, os.path.abspath(backup_filepath)
 
         except Exception as e:
             logger.error(f"Failed to create backup for {filepath}: {e}")
-            return False
+            return False, None
+
+    @staticmethod
+    def _backup_prefix(filepath: str) -> str:
+        """Backup name prefix for a file: its name plus a short hash of its resolved path."""
+        path_tag = hashlib.sha1(os.path.realpath(filepath).encode('utf-8', 'surrogateescape')).hexdigest()[:8]
+        return f"{Path(filepath).name}.{path_tag}."
 
     def _read_file(self, filepath: str) -> Optional[str]:
         """Read file content safely."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Read raw bytes and decode once instead of through a text-mode stream
+            with open(filepath, 'rb') as f:
+                content = f.read().decode('utf-8')
         except Exception as e:
             logger.error(f"Failed to read file {filepath}: {e}")
             return None
 
+        # Same newline handling as a text-mode read
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+
     def _write_file(self, filepath: str, content: str) -> bool:
         """Write file content safely."""
+        tmp_path = None
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            data = content.encode('utf-8')
+            # Write through symlinks: the swap below happens on the file they point to
+            target = os.path.realpath(filepath)
+            # Write a sibling temp file and swap it in, so the file is never half-written
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target),
+                                                prefix='.' + os.path.basename(target) + '.')
+            except PermissionError:
+                # No write access to the directory: fall back to writing the file in place
+                with open(target, 'wb') as f:
+                    f.write(data)
+                return True
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(target).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, target)
             return True
         except Exception as e:
             logger.error(f"Failed to write file {filepath}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             return False
 
     def _fix_line_length(self, content: str) -> Tuple[str, int]:
@@ -126,7 +300,19 @@ class AutoFormatter:
         Returns:
             Tuple of (formatted_content, changes_made)
         """
-        lines = content.split('\n')
+        # Only split the content when some line is actually too long
+        if not _LONG_LINE_RE.search(content):
+            return content, 0
+
+        lines, changes = self._fix_line_length_on_lines(content.split('\n'))
+        return content if lines is None else '\n'.join(lines), changes
+
+    def _fix_line_length_on_lines(self, lines: List[str]) -> Tuple[Optional[List[str]], int]:
+        """Line-list form of _fix_line_length; updates lines in place, None if unchanged."""
+        # Cheap no-op check: max and len both run in C
+        if max(map(len, lines), default=0) <= 80:
+            return None, 0
+
         changes = 0
 
         for i, line in enumerate(lines):
@@ -137,7 +323,7 @@ class AutoFormatter:
                     lines[i] = new_line
                     changes += 1
 
-        return '\n'.join(lines), changes
+        return (lines if changes else None), changes
 
     def _break_long_line(self, line: str) -> str:
         """Break a long line at logical points."""
@@ -155,73 +341,29 @@ class AutoFormatter:
             return self._break_at_function_params(line, indent_str)
 
         # 2. Break at operators
-        operators = [' && ', ' || ', ' + ', ' - ', ' * ', ' / ', ' = ', ' == ', ' != ', ' < ', ' > ']
-        for op in operators:
-            if op in line and line.find(op) < 70:
-                pos = line.rfind(op, 0, 70)
-                if pos > indent + 10:  # Ensure meaningful break
-                    return line[:pos + len(op)] + '\n' + indent_str + '\t' + line[pos + len(op):].lstrip()
+        # A single bounded rfind per candidate: it returns -1 whenever the
+        # operator does not occur before column 70, so no prior scan is needed.
+        for op in (' && ', ' || ', ' + ', ' - ', ' * ', ' / ', ' = ', ' == ', ' != ', ' < ', ' > '):
+            pos = line.rfind(op, 0, 70)
+            if pos > indent + 10:  # Ensure meaningful break
+                return line[:pos + len(op)] + '\n' + indent_str + '\t' + line[pos + len(op):].lstrip()
 
         # 3. Break at commas
-        if ',' in line:
-            pos = line.rfind(',', 0, 70)
-            if pos > indent + 10:
-                return line[:pos + 1] + '\n' + indent_str + '\t' + line[pos + 1:].lstrip()
+        pos = line.rfind(',', 0, 70)
+        if pos > indent + 10:
+            return line[:pos + 1] + '\n' + indent_str + '\t' + line[pos + 1:].lstrip()
 
         # 4. Break at string concatenation
-        if ' + "' in line or '" + ' in line:
-            for pattern in [' + "', '" + ']:
-                pos = line.rfind(pattern, 0, 70)
-                if pos > indent + 10:
-                    return line[:pos] + '\n' + indent_str + '\t' + line[pos:].lstrip()
+        for pattern in (' + "', '" + '):
+            pos = line.rfind(pattern, 0, 70)
+            if pos > indent + 10:
+                return line[:pos] + '\n' + indent_str + '\t' + line[pos:].lstrip()
 
         return line  # Return original if no good break point found
 
     def _break_at_function_params(self, line: str, indent_str: str) -> str:
         """Break long function calls at parameter boundaries."""
-        # Find function call pattern
-        match = re.search(r'(\w+\s*\()', line)
-        if not match:
-            return line
-
-        func_start = match.end()
-        paren_count = 1
-        params = []
-        current_param = ""
-
-        i = func_start
-        while i < len(line) and paren_count > 0:
-            char = line[i]
-            if char == '(':
-                paren_count += 1
-            elif char == ')':
-                paren_count -= 1
-                if paren_count == 0:
-                    if current_param.strip():
-                        params.append(current_param.strip())
-                    break
-            elif char == ',' and paren_count == 1:
-                params.append(current_param.strip())
-                current_param = ""
-                i += 1
-                continue
-
-            current_param += char
-            i += 1
-
-        if len(params) > 1:
-            # Reconstruct with line breaks
-            func_name = line[:func_start]
-            result = func_name
-            for j, param in enumerate(params):
-                if j == 0:
-                    result += param
-                else:
-                    result += ',\n' + indent_str + '\t' + param
-            result += line[i:]
-            return result
-
-        return line
+        return break_at_function_params(line, indent_str)
 
     def _fix_spacing(self, content: str) -> Tuple[str, int]:
         """
@@ -233,38 +375,30 @@ class AutoFormatter:
         Returns:
             Tuple of (formatted_content, changes_made)
         """
-        changes = 0
         original_content = content
 
         # Fix space after keywords
-        keywords = ['if', 'while', 'for', 'switch', 'return']
-        for keyword in keywords:
-            pattern = rf'\b{keyword}\('
-            replacement = f'{keyword} ('
-            new_content = re.sub(pattern, replacement, content)
-            if new_content != content:
-                changes += content.count(keyword + '(') - new_content.count(keyword + '(')
-                content = new_content
+        content, changes = _KEYWORD_RE.subn(r'\1 (', content)
 
         # Fix space before function names (remove extra spaces)
-        content = re.sub(r'\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', r' \1(', content)
+        content = _FUNC_SPACE_RE.sub(r' \1(', content)
 
-        # Fix space around operators
-        operators = ['=', '==', '!=', '<=', '>=', '<', '>', '+', '-', '*', '/', '%']
-        for op in operators:
+        # Fix space around operators; only the operators found by one scan need a pass
+        squeezed = set(_OPERATOR_RE.findall(content))
+        for op, pattern, replacement in _OPERATOR_SUBS:
+            if op not in squeezed:
+                continue
             # Add spaces around operators if missing
-            pattern = rf'(\w){re.escape(op)}(\w)'
-            replacement = rf'\1 {op} \2'
-            new_content = re.sub(pattern, replacement, content)
+            new_content = pattern.sub(replacement, content)
             if new_content != content:
                 changes += 1
                 content = new_content
 
         # Fix space after commas
-        content = re.sub(r',(\S)', r', \1', content)
+        content = _COMMA_RE.sub(r', \1', content)
 
         # Fix space after semicolons in for loops
-        content = re.sub(r';(\S)', r'; \1', content)
+        content = _SEMICOLON_RE.sub(r'; \1', content)
 
         if content != original_content:
             changes = max(changes, 1)
@@ -281,32 +415,12 @@ class AutoFormatter:
         Returns:
             Tuple of (formatted_content, changes_made)
         """
-        lines = content.split('\n')
-        changes = 0
-        indent_level = 0
-
-        for i, line in enumerate(lines):
-            if not line.strip():  # Skip empty lines
-                continue
+        lines, changes = self._fix_indentation_on_lines(content.split('\n'))
+        return content if lines is None else '\n'.join(lines), changes
 
-            # Calculate expected indent level
-            stripped = line.lstrip()
-
-            # Adjust indent level based on braces
-            if '}' in stripped:
-                indent_level = max(0, indent_level - stripped.count('}'))
-
-            # Apply correct indentation
-            expected_indent = '\t' * indent_level
-            if not line.startswith(expected_indent) and line.strip():
-                lines[i] = expected_indent + stripped
-                changes += 1
-
-            # Update indent level for next line
-            if '{' in stripped:
-                indent_level += stripped.count('{')
-
-        return '\n'.join(lines), changes
+    def _fix_indentation_on_lines(self, lines: List[str]) -> Tuple[Optional[List[str]], int]:
+        """Line-list form of _fix_indentation; updates lines in place, None if unchanged."""
+        return fix_indentation(lines)
 
     def _fix_braces(self, content: str) -> Tuple[str, int]:
         """
@@ -322,20 +436,19 @@ class AutoFormatter:
 
         # Fix opening braces - should be at end of line
         # Pattern: keyword/condition followed by newline and brace
-        pattern = r'(if|while|for|else)\s*\([^)]*\)\s*\n\s*{'
         def replace_brace(match):
             return match.group(0).replace('\n', ' ').replace('  {', ' {')
 
-        new_content = re.sub(pattern, replace_brace, content, flags=re.MULTILINE)
+        new_content = _BRACE_OPEN_RE.sub(replace_brace, content)
         if new_content != content:
             changes += 1
             content = new_content
 
         # Fix closing braces - should be on their own line
-        content = re.sub(r';\s*}', ';\n}', content)
+        content = _BRACE_CLOSE_RE.sub(';\n}', content)
 
         # Ensure newline after opening brace
-        content = re.sub(r'{\s*([^\n}])', r'{\n\t\1', content)
+        content = _BRACE_AFTER_RE.sub(r'{\n\t\1', content)
 
         return content, changes
 
@@ -351,29 +464,29 @@ class AutoFormatter:
             Tuple of (formatted_content, changes_made)
         """
         # Check if header already exists
-        if content.startswith('/*') and '42' in content[:500]:
+        if content.startswith('/*') and content.find('42', 0, 500) != -1:
             return content, 0
 
-        # Get file info
-        filename = Path(filepath).name
-
         # Use placeholder values - in real implementation, these would come from config
-        author = "student"
-        email = "student@student.42.fr"
-
-        import datetime
-        now = datetime.datetime.now()
-        created = now.strftime("%Y/%m/%d %H:%M:%S")
-        updated = created
-
-        # Format header
-        header = self.header_template.format(
-            filename=filename,
-            author=author,
-            email=email,
-            created=created,
-            updated=updated
-        )
+        created = self._now().strftime("%Y/%m/%d %H:%M:%S")
+
+        values = {
+            'filename': os.path.basename(filepath),
+            'author': "student",
+            'email': "student@student.42.fr",
+            'created': created,
+            'updated': created,
+        }
+
+        # Fill the pre-parsed template segments (parsed again if header_template was replaced)
+        template, parts = self._header_parts
+        if template != self.header_template:
+            parts = list(string.Formatter().parse(self.header_template))
+            self._header_parts = (self.header_template, parts)
+        header = ''.join([
+            literal + (format(values[field], spec) if field is not None else '')
+            for literal, field, spec, _ in parts
+        ])
 
         return header + content, 1
 
@@ -387,10 +500,14 @@ class AutoFormatter:
         Returns:
             Tuple of (formatted_content, changes_made)
         """
+        lines, changes = self._fix_comments_on_lines(content.split('\n'))
+        return content if lines is None else '\n'.join(lines), changes
+
+    def _fix_comments_on_lines(self, lines: List[str]) -> Tuple[Optional[List[str]], int]:
+        """Line-list form of _fix_comments; updates lines in place, None if unchanged."""
         changes = 0
 
         # Fix single-line comments to use /* */ format
-        lines = content.split('\n')
         for i, line in enumerate(lines):
             if '//' in line and not line.strip().startswith('//'):
                 # Convert inline // comments to /* */ format
@@ -401,7 +518,7 @@ class AutoFormatter:
                     lines[i] = before_comment + ' /* ' + comment_text + ' */'
                     changes += 1
 
-        return '\n'.join(lines), changes
+        return (lines if changes else None), changes
 
     def _fix_empty_lines(self, content: str) -> Tuple[str, int]:
         """
@@ -413,45 +530,12 @@ class AutoFormatter:
         Returns:
             Tuple of (formatted_content, changes_made)
         """
-        changes = 0
-        lines = content.split('\n')
-        result_lines = []
-        in_function = False
-        brace_count = 0
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            # Track function boundaries
-            if '{' in stripped:
-                brace_count += stripped.count('{')
-                if brace_count > 0:
-                    in_function = True
-
-            if '}' in stripped:
-                brace_count -= stripped.count('}')
-                if brace_count <= 0:
-                    in_function = False
-                    brace_count = 0
-
-            # Remove empty lines inside functions
-            if in_function and not stripped and brace_count > 0:
-                changes += 1
-                continue
-
-            # Handle consecutive newlines (keep only one)
-            if not stripped and result_lines and not result_lines[-1].strip():
-                changes += 1
-                continue
-
-            result_lines.append(line)
-
-        # Remove empty line at end of file
-        while result_lines and not result_lines[-1].strip():
-            result_lines.pop()
-            changes += 1
+        lines, changes = self._fix_empty_lines_on_lines(content.split('\n'))
+        return content if lines is None else '\n'.join(lines), changes
 
-        return '\n'.join(result_lines), changes
+    def _fix_empty_lines_on_lines(self, lines: List[str]) -> Tuple[Optional[List[str]], int]:
+        """Line-list form of _fix_empty_lines; returns a new list, None if unchanged."""
+        return fix_empty_lines(lines)
 
     def _fix_function_spacing(self, content: str) -> Tuple[str, int]:
         """
@@ -463,8 +547,12 @@ class AutoFormatter:
         Returns:
             Tuple of (formatted_content, changes_made)
         """
+        lines, changes = self._fix_function_spacing_on_lines(content.split('\n'))
+        return content if lines is None else '\n'.join(lines), changes
+
+    def _fix_function_spacing_on_lines(self, lines: List[str]) -> Tuple[Optional[List[str]], int]:
+        """Line-list form of _fix_function_spacing; returns a new list, None if unchanged."""
         changes = 0
-        lines = content.split('\n')
         result_lines = []
 
         for i, line in enumerate(lines):
@@ -487,7 +575,7 @@ class AutoFormatter:
 
             result_lines.append(line)
 
-        return '\n'.join(result_lines), changes
+        return (result_lines if changes else None), changes
 
     def _fix_tab_space_issues(self, content: str) -> Tuple[str, int]:
         """
@@ -499,41 +587,77 @@ class AutoFormatter:
         Returns:
             Tuple of (formatted_content, changes_made)
         """
-        changes = 0
-        lines = content.split('\n')
+        return fix_tab_space_issues(content)
 
-        for i, line in enumerate(lines):
-            if not line.strip():  # Skip empty lines
-                continue
+    def _apply_fixes(self, content: str, filepath: str, stages: FrozenSet[str]) -> Tuple[str, int]:
+        """
+        Run the given fixer stages, in pipeline order.
+
+        Text fixers (spacing, braces) work on the whole content and line fixers
+        on a list of lines. Content is only split or joined when the next fixer
+        needs the other form and the previous one changed something.
+
+        Args:
+            content: File content
+            filepath: Path to the file (used for the header)
+            stages: Fixer stages to run, from _fix_stages
+
+        Returns:
+            Tuple of (formatted_content, changes_made)
+        """
+        total_changes = 0
 
-            # Get leading whitespace
-            leading_whitespace = len(line) - len(line.lstrip())
-            if leading_whitespace == 0:
+        # Fix header issues
+        if '_add_header' in stages:
+            content, total_changes = self._add_header(content, filepath)
+
+        # The content is held as text, as lines, or both while they agree;
+        # None marks a form that is stale after a fixer changed the other one
+        lines = None
+        for rules, fixer_name, on_lines in _FIX_PIPELINE:
+            if fixer_name not in stages:
                 continue
 
-            whitespace = line[:leading_whitespace]
+            fixer = getattr(self, fixer_name)
+            if on_lines:
+                if lines is None:
+                    lines = content.split('\n')
+                new_lines, changes = fixer(lines)
+                if new_lines is not None:
+                    lines = new_lines
+                    content = None
+            else:
+                if content is None:
+                    content = '\n'.join(lines)
+                new_content, changes = fixer(content)
+                if new_content is not content and new_content != content:
+                    content = new_content
+                    lines = None
+            total_changes += changes
+
+        if content is None:
+            content = '\n'.join(lines)
 
-            # Check for mixed tabs and spaces in indentation
-            if '\t' in whitespace and ' ' in whitespace:
-                # Convert spaces to tabs for indentation
-                # Assume 4 spaces = 1 tab for conversion
-                spaces_count = whitespace.count(' ')
-                tabs_count = whitespace.count('\t')
-                total_tabs = tabs_count + (spaces_count // 4)
+        return content, total_changes
 
-                new_whitespace = '\t' * total_tabs
-                lines[i] = new_whitespace + line.lstrip()
-                changes += 1
+    def _apply_fixes_cached(self, content: str, filepath: str, stages: FrozenSet[str],
+                            keep: bool = True) -> Tuple[str, int]:
+        """
+        _apply_fixes, reusing the last result for the file while it is unchanged.
 
-            # Replace leading spaces with tabs (if more than 3 spaces)
-            elif ' ' in whitespace and '\t' not in whitespace and leading_whitespace >= 4:
-                tab_count = leading_whitespace // 4
-                remaining_spaces = leading_whitespace % 4
-                new_whitespace = '\t' * tab_count + ' ' * remaining_spaces
-                lines[i] = new_whitespace + line.lstrip()
-                changes += 1
+        Previews keep their result so that formatting the file afterwards runs
+        the pipeline once; format_file takes the entry out (keep=False) so a
+        batch does not hold on to the contents of every file.
+        """
+        cached = self._fix_cache.pop(filepath, None)
+        if cached is not None and cached[1] == stages and cached[0] == content:
+            result = cached[2]
+        else:
+            result = self._apply_fixes(content, filepath, stages)
 
-        return '\n'.join(lines), changes
+        if keep:
+            self._fix_cache[filepath] = (content, stages, result)
+        return result
 
     def format_file(self, filepath: str, error_analyses: List[ErrorAnalysis]) -> FormatResult:
         """
@@ -554,95 +678,83 @@ class AutoFormatter:
         if original_content is None:
             return FormatResult(False, f"Failed to read file: {filepath}")
 
-        # Create backup
-        if not self._create_backup(filepath):
-            return FormatResult(False, f"Failed to create backup for: {filepath}")
-
         # Apply fixes based on error analyses
         content = original_content
         total_changes = 0
 
-        # Get auto-fixable errors
-        auto_fixable = [analysis for analysis in error_analyses if analysis.auto_fixable]
-
-        if not auto_fixable:
-            return FormatResult(True, "No auto-fixable errors found", 0, original_content, content)
-
-        # Apply fixes in order of complexity (trivial first)
-        error_types = set(analysis.rule for analysis in auto_fixable)
-
-        # Fix header issues
-        if any(rule in ['HEADER_MISSING'] for rule in error_types):
-            content, changes = self._add_header(content, filepath)
-            total_changes += changes
-
-        # Fix spacing issues
-        if any(rule in ['SPACE_BEFORE_FUNC', 'SPACE_AFTER_KW'] for rule in error_types):
-            content, changes = self._fix_spacing(content)
-            total_changes += changes
-
-        # Fix indentation issues
-        if any(rule in ['INDENT_BRANCH', 'INDENT_MULT_BRANCH'] for rule in error_types):
-            content, changes = self._fix_indentation(content)
-            total_changes += changes
-
-        # Fix brace issues
-        if any(rule in ['BRACE_NEWLINE', 'BRACE_SHOULD_EOL'] for rule in error_types):
-            content, changes = self._fix_braces(content)
-            total_changes += changes
-
-        # Fix tab/space issues
-        if any(rule in ['SPACE_REPLACE_TAB', 'TAB_REPLACE_SPACE'] for rule in error_types):
-            content, changes = self._fix_tab_space_issues(content)
-            total_changes += changes
-
-        # Fix comment issues
-        if any(rule in ['WRONG_SCOPE_COMMENT'] for rule in error_types):
-            content, changes = self._fix_comments(content)
-            total_changes += changes
+        # Get the stages triggered by auto-fixable errors
+        stages = _fix_stages(error_analyses)
 
-        # Fix empty line issues
-        if any(rule in ['EMPTY_LINE_FUNCTION', 'EMPTY_LINE_EOF', 'CONSECUTIVE_NEWLINES'] for rule in error_types):
-            content, changes = self._fix_empty_lines(content)
-            total_changes += changes
+        # Contents are only held when asked for; otherwise they are read back from disk
+        kept = original_content if self.keep_content else None
 
-        # Fix function spacing
-        if any(rule in ['NEWLINE_PRECEDES_FUNC'] for rule in error_types):
-            content, changes = self._fix_function_spacing(content)
-            total_changes += changes
+        if stages is None:
+            return FormatResult(True, "No auto-fixable errors found", 0, kept, kept, filepath)
 
-        # Fix line length issues (do this last as it might affect other fixes)
-        if any(rule in ['TOO_LONG_LINE'] for rule in error_types):
-            content, changes = self._fix_line_length(content)
-            total_changes += changes
+        # Apply fixes in order of complexity (trivial first)
+        content, total_changes = self._apply_fixes_cached(content, filepath, stages, keep=False)
 
         # Write formatted content
         if total_changes > 0:
+            # Back up only files that are about to change
+            backed_up, backup_path = self._backup_file(filepath)
+            if not backed_up:
+                return FormatResult(False, f"Failed to create backup for: {filepath}")
+
             if self._write_file(filepath, content):
+                # Without a backup the original only survives in memory
+                original = original_content if self.keep_content or backup_path is None else None
                 return FormatResult(True, f"Successfully formatted file with {total_changes} changes", 
-                                  total_changes, original_content, content)
+                                  total_changes, original, content if self.keep_content else None,
+                                  filepath, backup_path)
             else:
                 return FormatResult(False, f"Failed to write formatted content to: {filepath}")
         else:
-            return FormatResult(True, "No changes needed", 0, original_content, content)
+            return FormatResult(True, "No changes needed", 0, kept, kept, filepath)
+
+    def _format_file_isolated(self, filepath: str, error_analyses: List[ErrorAnalysis]) -> FormatResult:
+        """format_file, turning an unexpected exception into a failed result for that file."""
+        try:
+            return self.format_file(filepath, error_analyses)
+        except Exception as e:
+            return FormatResult(False, f"Error - {e}", filepath=filepath)
 
     def format_multiple_files(self, file_analyses: Dict[str, List[ErrorAnalysis]]) -> Dict[str, FormatResult]:
         """
         Format multiple files.
 
+        Batches of PARALLEL_FORMAT_MIN_FILES or more are formatted in a process
+        pool. Each worker gets a copy of this formatter, so its settings,
+        header template and cached fix results apply there too; what the
+        workers change on their copies (new fix cache entries) is not copied
+        back. An exception while formatting a file only fails that file.
+
         Args:
             file_analyses: Dictionary mapping filepaths to their error analyses
 
         Returns:
             Dictionary mapping filepaths to their FormatResult objects
         """
-        results = {}
-
-        for filepath, analyses in file_analyses.items():
-            logger.info(f"Formatting file: {filepath}")
-            result = self.format_file(filepath, analyses)
-            results[filepath] = result
+        # Headers written during one batch share a single timestamp
+        self._batch_time = datetime.datetime.now()
+        try:
+            if len(file_analyses) >= PARALLEL_FORMAT_MIN_FILES:
+                # Files are independent, so large batches are formatted in parallel
+                logger.info(f"Formatting {len(file_analyses)} files in parallel")
+                with ProcessPoolExecutor(initializer=_init_format_worker, initargs=(self,)) as executor:
+                    results = dict(executor.map(_format_one, file_analyses.items(), chunksize=8))
+                # The workers used up their copies of these files' cached fixes
+                for filepath in file_analyses:
+                    self._fix_cache.pop(filepath, None)
+            else:
+                results = {}
+                for filepath, analyses in file_analyses.items():
+                    logger.info(f"Formatting file: {filepath}")
+                    results[filepath] = self._format_file_isolated(filepath, analyses)
+        finally:
+            self._batch_time = None
 
+        for filepath, result in results.items():
             if result.success:
                 logger.info(f"Successfully formatted {filepath}: {result.message}")
             else:
@@ -673,41 +785,13 @@ class AutoFormatter:
 
             # Apply formatting logic without writing to file
             content = original_content
-            auto_fixable = [analysis for analysis in error_analyses if analysis.auto_fixable]
+            stages = _fix_stages(error_analyses)
 
-            if not auto_fixable:
+            if stages is None:
                 return content
 
-            error_types = set(analysis.rule for analysis in auto_fixable)
-
             # Apply same fixes as format_file but don't write
-            if any(rule in ['HEADER_MISSING'] for rule in error_types):
-                content, _ = self._add_header(content, filepath)
-
-            if any(rule in ['SPACE_BEFORE_FUNC', 'SPACE_AFTER_KW'] for rule in error_types):
-                content, _ = self._fix_spacing(content)
-
-            if any(rule in ['INDENT_BRANCH', 'INDENT_MULT_BRANCH'] for rule in error_types):
-                content, _ = self._fix_indentation(content)
-
-            if any(rule in ['BRACE_NEWLINE', 'BRACE_SHOULD_EOL'] for rule in error_types):
-                content, _ = self._fix_braces(content)
-
-            if any(rule in ['SPACE_REPLACE_TAB', 'TAB_REPLACE_SPACE'] for rule in error_types):
-                content, _ = self._fix_tab_space_issues(content)
-
-            if any(rule in ['WRONG_SCOPE_COMMENT'] for rule in error_types):
-                content, _ = self._fix_comments(content)
-
-            if any(rule in ['EMPTY_LINE_FUNCTION', 'EMPTY_LINE_EOF', 'CONSECUTIVE_NEWLINES'] for rule in error_types):
-                content, _ = self._fix_empty_lines(content)
-
-            if any(rule in ['NEWLINE_PRECEDES_FUNC'] for rule in error_types):
-                content, _ = self._fix_function_spacing(content)
-
-            if any(rule in ['TOO_LONG_LINE'] for rule in error_types):
-                content, _ = self._fix_line_length(content)
-
+            content, _ = self._apply_fixes_cached(content, filepath, stages)
             return content
 
         finally:
@@ -730,19 +814,27 @@ class AutoFormatter:
                 logger.error("No backup directory found")
                 return False
 
-            filename = Path(filepath).name
-
-            # Find most recent backup
-            backup_files = list(backup_path.glob(f"{filename}.*.backup"))
-            if not backup_files:
+            prefix = self._backup_prefix(filepath)
+            legacy_prefix = Path(filepath).name + '.'
+            suffix = '.backup'
+
+            # Find most recent backup; the fixed-width timestamp in the name sorts chronologically.
+            # Backups named without a path tag (name.<timestamp>.backup) are used only if no tagged one exists.
+            with os.scandir(backup_path) as entries:
+                names = [entry.name for entry in entries if entry.name.endswith(suffix)]
+            backup_names = [name for name in names
+                            if name.startswith(prefix) and len(name) > len(prefix) + len(suffix)]
+            if not backup_names:
+                backup_names = [name for name in names
+                                if name.startswith(legacy_prefix) and len(name) > len(legacy_prefix) + len(suffix)
+                                and '.' not in name[len(legacy_prefix):-len(suffix)]]
+            if not backup_names:
                 logger.error(f"No backup found for {filepath}")
                 return False
 
-            # Sort by modification time, get most recent
-            most_recent = max(backup_files, key=lambda p: p.stat().st_mtime)
+            most_recent = backup_path / max(backup_names)
 
             # Restore file
-            import shutil
             shutil.copy2(most_recent, filepath)
 
             logger.info(f"Restored {filepath} from backup {most_recent}")
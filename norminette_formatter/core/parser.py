@@ -5,14 +5,55 @@ This module provides advanced parsing and analysis of norminette errors,
 including pattern detection, severity classification, and fix suggestions.
 """
 
+import heapq
 import re
-from typing import List, Dict, Optional, Set, Tuple
-from dataclasses import dataclass
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Immutable value objects; __slots__ are added where dataclasses support them (3.10+)
+_VALUE_OBJECT = dict(frozen=True, **({'slots': True} if sys.version_info >= (3, 10) else {}))
+
+# Patterns used to pull numeric context out of error descriptions
+_NUMBER_RE = re.compile(r'\d+')
+_LINE_LENGTH_RE = re.compile(r'(\d+)/80')
+_FUNCTION_LINES_RE = re.compile(r'(\d+)/25')
+_PARAM_COUNT_RE = re.compile(r'(\d+)/4')
+
+# Column accessors used to count analyses by attribute
+_SEVERITY = attrgetter('severity')
+_ERROR_TYPE = attrgetter('error_type')
+_FIX_COMPLEXITY_VALUE = attrgetter('fix_complexity.value')
+_AUTO_FIXABLE = attrgetter('auto_fixable')
+
+# Rules that point at functions or files doing too much
+_FUNCTION_COMPLEXITY_RULES = frozenset(['TOO_MANY_LINES', 'TOO_MANY_PARAMS', 'TOO_MANY_FUNCS'])
+
+# Errors that commonly occur together with a rule, shared read-only by every parser
+_RELATED_RULES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'TOO_LONG_LINE': ('SPACE_BEFORE_FUNC', 'SPACE_AFTER_KW'),
+    'TOO_MANY_LINES': ('TOO_MANY_FUNCS', 'VAR_DECL_START_FUNC'),
+    'INDENT_BRANCH': ('BRACE_NEWLINE', 'BRACE_SHOULD_EOL'),
+    'SPACE_BEFORE_FUNC': ('TOO_LONG_LINE', 'SPACE_AFTER_KW'),
+    'BRACE_NEWLINE': ('BRACE_SHOULD_EOL', 'INDENT_BRANCH'),
+    'VAR_DECL_START_FUNC': ('TOO_MANY_LINES',)
+})
+
+# rule -> (pattern, current key, excess key, limit, unit) for the rules with a "(n/limit)" description
+_CONTEXT_RULES = {
+    'TOO_LONG_LINE': (_LINE_LENGTH_RE, 'current_length', 'excess_chars', 80, 'characters'),
+    'TOO_MANY_LINES': (_FUNCTION_LINES_RE, 'current_lines', 'excess_lines', 25, 'lines'),
+    'TOO_MANY_PARAMS': (_PARAM_COUNT_RE, 'current_params', 'excess_params', 4, 'parameters'),
+}
+
 
 class ErrorSeverity(Enum):
     """Error severity levels."""
@@ -30,9 +71,41 @@ class FixComplexity(Enum):
     COMPLEX = "complex"      # Significant code changes needed
 
 
-@dataclass
+# Classification of rules missing from the pattern table
+_DEFAULT_PATTERN_INFO: Mapping[str, object] = MappingProxyType({
+    'severity': ErrorSeverity.MEDIUM,
+    'fix_complexity': FixComplexity.SIMPLE,
+    'auto_fixable': False
+})
+
+# (severity, complexity) -> packed priority; the auto-fix bonus is added as the lowest digit
+_SEVERITY_SCORES = {
+    ErrorSeverity.CRITICAL: 4,
+    ErrorSeverity.HIGH: 3,
+    ErrorSeverity.MEDIUM: 2,
+    ErrorSeverity.LOW: 1
+}
+_COMPLEXITY_SCORES = {
+    FixComplexity.TRIVIAL: 4,
+    FixComplexity.SIMPLE: 3,
+    FixComplexity.MODERATE: 2,
+    FixComplexity.COMPLEX: 1
+}
+_PRIORITY_BASE = {
+    (severity, complexity): severity_score * 100 + complexity_score * 10
+    for severity, severity_score in _SEVERITY_SCORES.items()
+    for complexity, complexity_score in _COMPLEXITY_SCORES.items()
+}
+
+
+def _priority_key(analysis) -> int:
+    """Packed (severity, complexity, auto-fix) priority; orders like the tuple it replaces."""
+    return _PRIORITY_BASE[analysis.severity, analysis.fix_complexity] + (1 if analysis.auto_fixable else 0)
+
+
+@dataclass(**_VALUE_OBJECT)
 class ErrorAnalysis:
-    """Detailed analysis of a norminette error."""
+    """Detailed analysis of a norminette error (immutable; hashed without its list and dict fields)."""
     rule: str
     line: int
     column: int
@@ -42,8 +115,8 @@ class ErrorAnalysis:
     fix_complexity: FixComplexity
     fix_suggestion: str
     auto_fixable: bool
-    related_errors: List[str]
-    context: Dict[str, any]
+    related_errors: List[str] = field(hash=False)
+    context: Dict[str, any] = field(hash=False)
 
 
 class ErrorParser:
@@ -57,14 +130,24 @@ class ErrorParser:
     - Error grouping and prioritization
     """
 
-    def __init__(self):
-        """Initialize the error parser."""
+    def __init__(self, extract_all_numbers: bool = False):
+        """
+        Initialize the error parser.
+
+        Args:
+            extract_all_numbers: Also store every number in a description as context['values']
+        """
+        self.extract_all_numbers = extract_all_numbers
         self.error_patterns = self._load_error_patterns()
         self.fix_templates = self._load_fix_templates()
-
-    def _load_error_patterns(self) -> Dict[str, Dict]:
-        """Load error pattern definitions."""
-        return {
+        # Per-instance memo of the parts of an analysis that depend only on (rule, description)
+        self._analyze_signature = lru_cache(maxsize=4096)(self._analyze_signature)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_error_patterns() -> Mapping[str, Mapping[str, object]]:
+        """Load error pattern definitions, with each 'pattern' compiled (built once, shared read-only)."""
+        patterns = {
             'TOO_LONG_LINE': {
                 'severity': ErrorSeverity.MEDIUM,
                 'fix_complexity': FixComplexity.SIMPLE,
@@ -221,9 +304,17 @@ class ErrorParser:
             }
         }
 
-    def _load_fix_templates(self) -> Dict[str, str]:
-        """Load fix suggestion templates."""
-        return {
+        # Every parser gets these same tables, so neither level may be mutated
+        for rule, info in patterns.items():
+            info['pattern'] = re.compile(info['pattern'])
+            patterns[rule] = MappingProxyType(info)
+        return MappingProxyType(patterns)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_fix_templates() -> Mapping[str, str]:
+        """Load fix suggestion templates (built once, shared read-only)."""
+        return MappingProxyType({
             'TOO_LONG_LINE': 'Break line at logical points (operators, commas, function calls)',
             'TOO_MANY_LINES': 'Split function into smaller, more focused functions',
             'TOO_MANY_FUNCS': 'Move some functions to separate files or combine related functions',
@@ -246,7 +337,7 @@ class ErrorParser:
             'EMPTY_LINE_EOF': 'Remove empty line at end of file',
             'NEWLINE_PRECEDES_FUNC': 'Add newline before function definition',
             'CONSECUTIVE_NEWLINES': 'Remove consecutive empty lines'
-        }
+        })
 
     def analyze_error(self, error: Dict) -> ErrorAnalysis:
         """
@@ -258,28 +349,15 @@ class ErrorParser:
         Returns:
             ErrorAnalysis object with detailed information
         """
-        rule = error.get('rule', 'UNKNOWN')
+        # Rule and type are interned so the many equal strings share one object
+        rule = sys.intern(error.get('rule', 'UNKNOWN'))
         line = error.get('line', 0)
         column = error.get('column', 0)
         description = error.get('description', '')
-        error_type = error.get('type', 'unknown')
-
-        # Get pattern information
-        pattern_info = self.error_patterns.get(rule, {
-            'severity': ErrorSeverity.MEDIUM,
-            'fix_complexity': FixComplexity.SIMPLE,
-            'auto_fixable': False,
-            'description': description
-        })
-
-        # Extract additional context from description
-        context = self._extract_context(rule, description)
-
-        # Generate fix suggestion
-        fix_suggestion = self._generate_fix_suggestion(rule, context)
+        error_type = sys.intern(error.get('type', 'unknown'))
 
-        # Determine related errors
-        related_errors = self._find_related_errors(rule)
+        severity, fix_complexity, auto_fixable, fix_suggestion, related_errors, context = \
+            self._analyze_signature(rule, description)
 
         return ErrorAnalysis(
             rule=rule,
@@ -287,41 +365,60 @@ class ErrorParser:
             column=column,
             description=description,
             error_type=error_type,
-            severity=pattern_info['severity'],
-            fix_complexity=pattern_info['fix_complexity'],
+            severity=severity,
+            fix_complexity=fix_complexity,
             fix_suggestion=fix_suggestion,
-            auto_fixable=pattern_info['auto_fixable'],
-            related_errors=related_errors,
-            context=context
+            auto_fixable=auto_fixable,
+            related_errors=list(related_errors),
+            context=dict(context)
         )
 
-    def _extract_context(self, rule: str, description: str) -> Dict[str, any]:
-        """Extract additional context from error description."""
-        context = {}
+    def _analyze_signature(self, rule: str, description: str) -> Tuple:
+        """
+        Analyze the parts of an error that depend only on its rule and description.
 
-        # Extract numeric values (line counts, character counts, etc.)
-        numbers = re.findall(r'\d+', description)
-        if numbers:
-            context['values'] = [int(n) for n in numbers]
+        Memoized per parser instance, since norminette repeats the same
+        (rule, description) pair many times; analyze_error copies the
+        mutable parts for each ErrorAnalysis.
 
-        # Rule-specific context extraction
-        if rule == 'TOO_LONG_LINE':
-            match = re.search(r'(\d+)/80', description)
-            if match:
-                context['current_length'] = int(match.group(1))
-                context['excess_chars'] = int(match.group(1)) - 80
+        Returns:
+            Tuple of (severity, fix_complexity, auto_fixable, fix_suggestion,
+            related_errors, context)
+        """
+        # Get pattern information
+        pattern_info = self.error_patterns.get(rule, _DEFAULT_PATTERN_INFO)
 
-        elif rule == 'TOO_MANY_LINES':
-            match = re.search(r'(\d+)/25', description)
-            if match:
-                context['current_lines'] = int(match.group(1))
-                context['excess_lines'] = int(match.group(1)) - 25
+        # Extract additional context from description
+        context = self._extract_context(rule, description)
 
-        elif rule == 'TOO_MANY_PARAMS':
-            match = re.search(r'(\d+)/4', description)
+        # Generate fix suggestion
+        fix_suggestion = self._generate_fix_suggestion(rule, context)
+
+        # Determine related errors (shared tuple; analyze_error makes the list)
+        related_errors = _RELATED_RULES.get(rule, ())
+
+        return (pattern_info['severity'], pattern_info['fix_complexity'], pattern_info['auto_fixable'],
+                fix_suggestion, related_errors, context)
+
+    def _extract_context(self, rule: str, description: str) -> Dict[str, any]:
+        """Extract additional context from error description."""
+        context = {}
+
+        # Extract numeric values (line counts, character counts, etc.) only on request
+        if self.extract_all_numbers:
+            numbers = _NUMBER_RE.findall(description)
+            if numbers:
+                context['values'] = [int(n) for n in numbers]
+
+        # Rule-specific context extraction, dispatched by table
+        rule_context = _CONTEXT_RULES.get(rule)
+        if rule_context is not None:
+            pattern, current_key, excess_key, limit, _ = rule_context
+            match = pattern.search(description)
             if match:
-                context['current_params'] = int(match.group(1))
-                context['excess_params'] = int(match.group(1)) - 4
+                current = int(match.group(1))
+                context[current_key] = current
+                context[excess_key] = current - limit
 
         return context
 
@@ -329,33 +426,18 @@ class ErrorParser:
         """Generate specific fix suggestion based on rule and context."""
         base_suggestion = self.fix_templates.get(rule, 'Manual fix required')
 
-        # Add context-specific details
-        if rule == 'TOO_LONG_LINE' and 'excess_chars' in context:
-            excess = context['excess_chars']
-            base_suggestion += f" (reduce by {excess} characters)"
-
-        elif rule == 'TOO_MANY_LINES' and 'excess_lines' in context:
-            excess = context['excess_lines']
-            base_suggestion += f" (reduce by {excess} lines)"
-
-        elif rule == 'TOO_MANY_PARAMS' and 'excess_params' in context:
-            excess = context['excess_params']
-            base_suggestion += f" (reduce by {excess} parameters)"
+        # Add context-specific details, from the same table as the context
+        rule_context = _CONTEXT_RULES.get(rule)
+        if rule_context is not None:
+            _, _, excess_key, _, unit = rule_context
+            if excess_key in context:
+                base_suggestion += f" (reduce by {context[excess_key]} {unit})"
 
         return base_suggestion
 
     def _find_related_errors(self, rule: str) -> List[str]:
         """Find errors that are commonly related to the given rule."""
-        related_map = {
-            'TOO_LONG_LINE': ['SPACE_BEFORE_FUNC', 'SPACE_AFTER_KW'],
-            'TOO_MANY_LINES': ['TOO_MANY_FUNCS', 'VAR_DECL_START_FUNC'],
-            'INDENT_BRANCH': ['BRACE_NEWLINE', 'BRACE_SHOULD_EOL'],
-            'SPACE_BEFORE_FUNC': ['TOO_LONG_LINE', 'SPACE_AFTER_KW'],
-            'BRACE_NEWLINE': ['BRACE_SHOULD_EOL', 'INDENT_BRANCH'],
-            'VAR_DECL_START_FUNC': ['TOO_MANY_LINES']
-        }
-
-        return related_map.get(rule, [])
+        return list(_RELATED_RULES.get(rule, ()))
 
     def analyze_file_errors(self, errors: List[Dict]) -> List[ErrorAnalysis]:
         """
@@ -367,25 +449,17 @@ class ErrorParser:
         Returns:
             List of ErrorAnalysis objects
         """
-        analyses = []
-
-        for error in errors:
-            analysis = self.analyze_error(error)
-            analyses.append(analysis)
-
-        return analyses
+        analyze_error = self.analyze_error
+        return [analyze_error(error) for error in errors]
 
     def group_errors_by_type(self, analyses: List[ErrorAnalysis]) -> Dict[str, List[ErrorAnalysis]]:
         """Group error analyses by error type."""
-        groups = {}
+        groups = defaultdict(list)
 
         for analysis in analyses:
-            error_type = analysis.error_type
-            if error_type not in groups:
-                groups[error_type] = []
-            groups[error_type].append(analysis)
+            groups[analysis.error_type].append(analysis)
 
-        return groups
+        return dict(groups)
 
     def group_errors_by_severity(self, analyses: List[ErrorAnalysis]) -> Dict[ErrorSeverity, List[ErrorAnalysis]]:
         """Group error analyses by severity."""
@@ -396,6 +470,11 @@ class ErrorParser:
 
         return groups
 
+    def count_errors_by_severity(self, analyses: List[ErrorAnalysis]) -> Dict[ErrorSeverity, int]:
+        """Count error analyses per severity, without building the groups."""
+        counts = Counter(map(_SEVERITY, analyses))
+        return {severity: counts[severity] for severity in ErrorSeverity}
+
     def get_auto_fixable_errors(self, analyses: List[ErrorAnalysis]) -> List[ErrorAnalysis]:
         """Get list of errors that can be automatically fixed."""
         return [analysis for analysis in analyses if analysis.auto_fixable]
@@ -407,29 +486,8 @@ class ErrorParser:
         Returns:
             Sorted list with highest priority errors first
         """
-        severity_order = {
-            ErrorSeverity.CRITICAL: 4,
-            ErrorSeverity.HIGH: 3,
-            ErrorSeverity.MEDIUM: 2,
-            ErrorSeverity.LOW: 1
-        }
-
-        complexity_order = {
-            FixComplexity.TRIVIAL: 4,
-            FixComplexity.SIMPLE: 3,
-            FixComplexity.MODERATE: 2,
-            FixComplexity.COMPLEX: 1
-        }
-
-        def priority_key(analysis):
-            severity_score = severity_order[analysis.severity]
-            complexity_score = complexity_order[analysis.fix_complexity]
-            auto_fix_bonus = 1 if analysis.auto_fixable else 0
-
-            # Higher severity and easier fixes get higher priority
-            return (severity_score, complexity_score, auto_fix_bonus)
-
-        return sorted(analyses, key=priority_key, reverse=True)
+        # Higher severity and easier fixes get higher priority
+        return sorted(analyses, key=_priority_key, reverse=True)
 
     def detect_error_patterns(self, analyses: List[ErrorAnalysis]) -> Dict[str, List[ErrorAnalysis]]:
         """
@@ -438,25 +496,39 @@ class ErrorParser:
         Returns:
             Dictionary mapping pattern names to lists of related errors
         """
+        # Classify every analysis in one pass
+        spacing_errors = []
+        indent_errors = []
+        func_errors = []
+        line_length_errors = []
+        for analysis in analyses:
+            error_type = analysis.error_type
+            if error_type == 'spacing':
+                spacing_errors.append(analysis)
+            elif error_type == 'indentation':
+                indent_errors.append(analysis)
+
+            rule = analysis.rule
+            if rule in _FUNCTION_COMPLEXITY_RULES:
+                func_errors.append(analysis)
+            elif rule == 'TOO_LONG_LINE':
+                line_length_errors.append(analysis)
+
         patterns = {}
 
         # Pattern: Multiple spacing issues
-        spacing_errors = [a for a in analyses if a.error_type == 'spacing']
         if len(spacing_errors) > 2:
             patterns['multiple_spacing_issues'] = spacing_errors
 
         # Pattern: Consistent indentation problems
-        indent_errors = [a for a in analyses if a.error_type == 'indentation']
         if len(indent_errors) > 3:
             patterns['consistent_indentation_issues'] = indent_errors
 
         # Pattern: Function complexity issues
-        func_errors = [a for a in analyses if a.rule in ['TOO_MANY_LINES', 'TOO_MANY_PARAMS', 'TOO_MANY_FUNCS']]
         if len(func_errors) > 1:
             patterns['function_complexity_issues'] = func_errors
 
         # Pattern: Line length issues throughout file
-        line_length_errors = [a for a in analyses if a.rule == 'TOO_LONG_LINE']
         if len(line_length_errors) > 5:
             patterns['widespread_line_length_issues'] = line_length_errors
 
@@ -469,28 +541,22 @@ class ErrorParser:
 
         # Basic counts
         total_errors = len(analyses)
-        auto_fixable = len(self.get_auto_fixable_errors(analyses))
 
-        # Severity breakdown
-        severity_groups = self.group_errors_by_severity(analyses)
-        severity_counts = {sev.value: len(errors) for sev, errors in severity_groups.items()}
+        # Breakdowns are counted column by column in C instead of building a list per group
+        auto_fixable = sum(map(bool, map(_AUTO_FIXABLE, analyses)))
 
-        # Type breakdown
-        type_groups = self.group_errors_by_type(analyses)
-        type_counts = {error_type: len(errors) for error_type, errors in type_groups.items()}
+        # Severity breakdown (every level is reported, in enum order)
+        severity_counts = {sev.value: count for sev, count in self.count_errors_by_severity(analyses).items()}
 
-        # Complexity breakdown
-        complexity_counts = {}
-        for analysis in analyses:
-            complexity = analysis.fix_complexity.value
-            complexity_counts[complexity] = complexity_counts.get(complexity, 0) + 1
+        # Type and complexity breakdowns are returned as the Counters themselves (dict subclasses)
+        type_counts = Counter(map(_ERROR_TYPE, analyses))
+        complexity_counts = Counter(map(_FIX_COMPLEXITY_VALUE, analyses))
 
-        # Pattern detection
-        patterns = self.detect_error_patterns(analyses)
+        # Pattern detection; every pattern needs at least two errors
+        patterns = self.detect_error_patterns(analyses) if total_errors > 1 else {}
 
-        # Priority analysis
-        prioritized = self.prioritize_errors(analyses)
-        top_priority = prioritized[:5] if len(prioritized) >= 5 else prioritized
+        # Priority analysis: same as prioritize_errors(analyses)[:5], without a full sort
+        top_priority = heapq.nlargest(5, analyses, key=_priority_key)
 
         return {
             'total_errors': total_errors,
@@ -499,7 +565,7 @@ class ErrorParser:
             'severity_breakdown': severity_counts,
             'type_breakdown': type_counts,
             'complexity_breakdown': complexity_counts,
-            'detected_patterns': list(patterns.keys()),
+            'detected_patterns': list(patterns),
             'pattern_details': {name: len(errors) for name, errors in patterns.items()},
             'top_priority_errors': [
                 {
@@ -5,15 +5,64 @@ This module provides functionality to scan C files using the norminette tool
 and capture error information for further processing.
 """
 
+import asyncio
 import subprocess
 import os
 import re
-from typing import List, Dict, Optional, Tuple
-from pathlib import Path
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator, List, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds allowed per file for a norminette run
+NORMINETTE_TIMEOUT = 30
+
+# Files passed to one norminette process by scan_directory; large batches keep process launches rare
+NORMINETTE_BATCH_SIZE = 100
+
+# Norminette batches scan_directory runs at the same time; the threads only wait on child processes
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Error type category for each norminette rule
+_ERROR_TYPES = {
+    'TOO_MANY_LINES': 'line_length',
+    'TOO_LONG_LINE': 'line_length',
+    'TOO_MANY_FUNCS': 'function_count',
+    'TOO_MANY_PARAMS': 'function_params',
+    'SPACE_BEFORE_FUNC': 'spacing',
+    'SPACE_AFTER_KW': 'spacing',
+    'SPACE_REPLACE_TAB': 'spacing',
+    'TAB_REPLACE_SPACE': 'spacing',
+    'INDENT_BRANCH': 'indentation',
+    'INDENT_MULT_BRANCH': 'indentation',
+    'WRONG_SCOPE_COMMENT': 'comments',
+    'MISSING_IDENTIFIER': 'header',
+    'HEADER_MISSING': 'header',
+    'INVALID_HEADER': 'header',
+    'BRACE_NEWLINE': 'braces',
+    'BRACE_SHOULD_EOL': 'braces',
+    'BRACE_SHOULD_NEWLINE': 'braces',
+    'VAR_DECL_START_FUNC': 'variables',
+    'DECL_ASSIGN_LINE': 'variables',
+    'EMPTY_LINE_FUNCTION': 'formatting',
+    'EMPTY_LINE_EOF': 'formatting',
+    'NEWLINE_PRECEDES_FUNC': 'formatting',
+    'CONSECUTIVE_NEWLINES': 'formatting'
+}
+
+# One error line: "Error: RULE_NAME (line: N, col: N): description"
+_ERROR_RE = re.compile(r'Error:\s+(\w+)\s+\(line:\s*(\d+),\s*col:\s*(\d+)\):\s*(.*)')
+
+# "Error:" through the end of its output line
+_ERROR_LINE_RE = re.compile(r'Error:[^\n]*')
+
+# Per-file header norminette prints before that file's errors
+_FILE_HEADER_RE = re.compile(r'^(.+): (?:OK|Error)!\s*$', re.MULTILINE)
+
 
 class NorminetteResult:
     """Represents the result of a norminette scan on a single file."""
@@ -48,6 +97,8 @@ class NorminetteScanner:
         """
         self.norminette_path = norminette_path
         self.results: List[NorminetteResult] = []
+        self._available: Optional[bool] = None  # Result of the first availability check
+        self._available_lock = threading.Lock()  # Concurrent first scans wait for one check
 
     def _check_norminette_available(self) -> bool:
         """Check if norminette is available in the system."""
@@ -62,31 +113,81 @@ class NorminetteScanner:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return False
 
-    def _run_norminette(self, filepath: str) -> Tuple[int, str, str]:
+    def _norminette_available(self) -> bool:
+        """Check norminette availability once and reuse the answer for later scans."""
+        if self._available is None:
+            with self._available_lock:
+                if self._available is None:
+                    self._available = self._check_norminette_available()
+        return self._available
+
+    def refresh_availability(self) -> bool:
+        """
+        Check again whether norminette can be run, e.g. after installing it.
+
+        Returns:
+            True if norminette is available
+        """
+        self._available = self._check_norminette_available()
+        return self._available
+
+    def _run_norminette(self, *filepaths: str) -> Tuple[int, str, str]:
         """
-        Run norminette on a single file.
+        Run norminette on one or more files in a single process.
 
         Args:
-            filepath: Path to the C file to scan
+            filepaths: Paths to the C files to scan
 
         Returns:
             Tuple of (return_code, stdout, stderr)
         """
+        target = ", ".join(filepaths)
         try:
             result = subprocess.run(
-                [self.norminette_path, filepath],
+                [self.norminette_path, *filepaths],
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=NORMINETTE_TIMEOUT * len(filepaths)
             )
             return result.returncode, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
-            logger.error(f"Norminette timeout for file: {filepath}")
+            logger.error(f"Norminette timeout for file: {target}")
             return -1, "", "Timeout"
         except Exception as e:
-            logger.error(f"Error running norminette on {filepath}: {e}")
+            logger.error(f"Error running norminette on {target}: {e}")
             return -1, "", str(e)
 
+    async def _run_norminette_async(self, *filepaths: str) -> Tuple[int, str, str]:
+        """
+        Run norminette on one or more files without blocking the event loop.
+
+        Args:
+            filepaths: Paths to the C files to scan
+
+        Returns:
+            Tuple of (return_code, stdout, stderr)
+        """
+        target = ", ".join(filepaths)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self.norminette_path, *filepaths,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            logger.error(f"Error running norminette on {target}: {e}")
+            return -1, "", str(e)
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=NORMINETTE_TIMEOUT * len(filepaths))
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error(f"Norminette timeout for file: {target}")
+            return -1, "", "Timeout"
+
+        return proc.returncode, stdout.decode(errors='replace'), stderr.decode(errors='replace')
+
     def _parse_norminette_output(self, filepath: str, stdout: str, stderr: str) -> NorminetteResult:
         """
         Parse norminette output into structured data.
@@ -104,31 +205,33 @@ class NorminetteScanner:
 
         errors = []
 
-        # Parse error lines - norminette format: "Error: RULE_NAME (line:col): description"
-        error_pattern = r'Error:\s+(\w+)\s+\(line:\s*(\d+),\s*col:\s*(\d+)\):\s*(.*)'
-
-        for line in stdout.split('\n'):
-            line = line.strip()
-            if line.startswith('Error:'):
-                match = re.match(error_pattern, line)
-                if match:
-                    rule_name, line_num, col_num, description = match.groups()
-                    errors.append({
-                        'rule': rule_name,
-                        'line': int(line_num),
-                        'column': int(col_num),
-                        'description': description.strip(),
-                        'type': self._classify_error_type(rule_name)
-                    })
-                else:
-                    # Fallback parsing for different norminette output formats
-                    errors.append({
-                        'rule': 'UNKNOWN',
-                        'line': 0,
-                        'column': 0,
-                        'description': line,
-                        'type': 'unknown'
-                    })
+        # Parse error lines - norminette format: "Error: RULE_NAME (line:col): description".
+        # Error lines are found lazily in the output, without splitting all of it into lines.
+        for error_line in _ERROR_LINE_RE.finditer(stdout):
+            start, end = error_line.span()
+            # Fast path: norminette prints error lines unindented
+            if start and stdout[start - 1] != '\n' and stdout[stdout.rfind('\n', 0, start) + 1:start].strip():
+                continue  # "Error:" in the middle of a line
+            # Match in place; only the captured description gets stripped
+            match = _ERROR_RE.match(stdout, start, end)
+            if match:
+                rule_name, line_num, col_num, description = match.groups()
+                errors.append({
+                    'rule': rule_name,
+                    'line': int(line_num),
+                    'column': int(col_num),
+                    'description': description.strip(),
+                    'type': self._classify_error_type(rule_name)
+                })
+            else:
+                # Fallback parsing for different norminette output formats
+                errors.append({
+                    'rule': 'UNKNOWN',
+                    'line': 0,
+                    'column': 0,
+                    'description': error_line.group().strip(),
+                    'type': 'unknown'
+                })
 
         status = "Error" if errors else "OK"
         return NorminetteResult(filepath, status, errors)
@@ -143,33 +246,7 @@ class NorminetteScanner:
         Returns:
             Error type category
         """
-        type_mapping = {
-            'TOO_MANY_LINES': 'line_length',
-            'TOO_LONG_LINE': 'line_length',
-            'TOO_MANY_FUNCS': 'function_count',
-            'TOO_MANY_PARAMS': 'function_params',
-            'SPACE_BEFORE_FUNC': 'spacing',
-            'SPACE_AFTER_KW': 'spacing',
-            'SPACE_REPLACE_TAB': 'spacing',
-            'TAB_REPLACE_SPACE': 'spacing',
-            'INDENT_BRANCH': 'indentation',
-            'INDENT_MULT_BRANCH': 'indentation',
-            'WRONG_SCOPE_COMMENT': 'comments',
-            'MISSING_IDENTIFIER': 'header',
-            'HEADER_MISSING': 'header',
-            'INVALID_HEADER': 'header',
-            'BRACE_NEWLINE': 'braces',
-            'BRACE_SHOULD_EOL': 'braces',
-            'BRACE_SHOULD_NEWLINE': 'braces',
-            'VAR_DECL_START_FUNC': 'variables',
-            'DECL_ASSIGN_LINE': 'variables',
-            'EMPTY_LINE_FUNCTION': 'formatting',
-            'EMPTY_LINE_EOF': 'formatting',
-            'NEWLINE_PRECEDES_FUNC': 'formatting',
-            'CONSECUTIVE_NEWLINES': 'formatting'
-        }
-
-        return type_mapping.get(rule_name, 'other')
+        return _ERROR_TYPES.get(rule_name, 'other')
 
     def scan_file(self, filepath: str) -> NorminetteResult:
         """
@@ -181,6 +258,173 @@ class NorminetteScanner:
         Returns:
             NorminetteResult object
         """
+        skipped = self._check_scannable(filepath)
+        if skipped is not None:
+            return skipped
+
+        if not self._norminette_available():
+            return self._norminette_missing_result(filepath)
+
+        return_code, stdout, stderr = self._run_norminette(filepath)
+        result = self._parse_norminette_output(filepath, stdout, stderr)
+
+        return result
+
+    async def scan_file_async(self, filepath: str) -> NorminetteResult:
+        """
+        Scan a single C file using an asyncio subprocess.
+
+        Args:
+            filepath: Path to the C file
+
+        Returns:
+            NorminetteResult object
+        """
+        skipped = self._check_scannable(filepath)
+        if skipped is not None:
+            return skipped
+
+        loop = asyncio.get_running_loop()
+        available = self._available
+        if available is None:
+            available = await loop.run_in_executor(None, self._norminette_available)
+        if not available:
+            return self._norminette_missing_result(filepath)
+
+        return_code, stdout, stderr = await self._run_norminette_async(filepath)
+        return self._parse_norminette_output(filepath, stdout, stderr)
+
+    def _split_batch_output(self, filepaths: List[str], stdout: str) -> Dict[str, str]:
+        """
+        Split the output of a multi-file norminette run into per-file sections.
+
+        Args:
+            filepaths: Paths passed to norminette
+            stdout: Standard output from norminette
+
+        Returns:
+            Dictionary mapping each reported path to its section of the output
+        """
+        expected = set(filepaths)
+        headers = [m for m in _FILE_HEADER_RE.finditer(stdout) if m.group(1) in expected]
+
+        sections = {}
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            end = next_header.start() if next_header is not None else len(stdout)
+            sections[header.group(1)] = stdout[header.start():end]
+
+        return sections
+
+    def scan_files(self, filepaths: List[str]) -> List[NorminetteResult]:
+        """
+        Scan several C files with a single norminette process.
+
+        Files missing from the combined output are rescanned individually;
+        if the norminette run itself fails, every file gets an error result.
+
+        Args:
+            filepaths: Paths to the C files
+
+        Returns:
+            List of NorminetteResult objects, in the order of filepaths
+        """
+        results, pending = self._prepare_batch(filepaths)
+        if not pending:
+            return [results[f] for f in filepaths]
+
+        if not self._norminette_available():
+            results.update((f, self._norminette_missing_result(f)) for f in pending)
+            return [results[f] for f in filepaths]
+
+        return_code, stdout, stderr = self._run_norminette(*pending)
+        for filepath in self._collect_batch_results(results, pending, return_code, stdout, stderr):
+            return_code, stdout, stderr = self._run_norminette(filepath)
+            results[filepath] = self._parse_norminette_output(filepath, stdout, stderr)
+
+        return [results[f] for f in filepaths]
+
+    async def scan_files_async(self, filepaths: List[str]) -> List[NorminetteResult]:
+        """
+        Scan several C files with a single asyncio norminette subprocess.
+
+        Files missing from the combined output are rescanned individually;
+        if the norminette run itself fails, every file gets an error result.
+
+        Args:
+            filepaths: Paths to the C files
+
+        Returns:
+            List of NorminetteResult objects, in the order of filepaths
+        """
+        results, pending = self._prepare_batch(filepaths)
+        if not pending:
+            return [results[f] for f in filepaths]
+
+        loop = asyncio.get_running_loop()
+        available = self._available
+        if available is None:
+            available = await loop.run_in_executor(None, self._norminette_available)
+        if not available:
+            results.update((f, self._norminette_missing_result(f)) for f in pending)
+            return [results[f] for f in filepaths]
+
+        return_code, stdout, stderr = await self._run_norminette_async(*pending)
+        for filepath in self._collect_batch_results(results, pending, return_code, stdout, stderr):
+            return_code, stdout, stderr = await self._run_norminette_async(filepath)
+            results[filepath] = self._parse_norminette_output(filepath, stdout, stderr)
+
+        return [results[f] for f in filepaths]
+
+    def _collect_batch_results(self, results: Dict[str, NorminetteResult], pending: List[str],
+                               return_code: int, stdout: str, stderr: str) -> List[str]:
+        """
+        Fill in results from the output of a multi-file norminette run.
+
+        If the run itself failed (e.g. timed out), every pending file gets an
+        error result, since rerunning each file could take as long again.
+
+        Args:
+            results: Results by path, updated in place
+            pending: Paths passed to norminette
+            return_code: Return code of the run (-1 if it could not complete)
+            stdout: Standard output from norminette
+            stderr: Standard error from norminette
+
+        Returns:
+            Paths missing from the output, to be rescanned individually
+        """
+        if return_code == -1:
+            results.update((f, self._norminette_failed_result(f, stderr)) for f in pending)
+            return []
+
+        sections = self._split_batch_output(pending, stdout)
+        missing = []
+
+        for filepath in pending:
+            if filepath in sections:
+                results[filepath] = self._parse_norminette_output(filepath, sections[filepath], stderr)
+            else:
+                missing.append(filepath)
+
+        return missing
+
+    def _prepare_batch(self, filepaths: List[str]) -> Tuple[Dict[str, NorminetteResult], List[str]]:
+        """Resolve files that need no norminette run and list the remaining ones."""
+        results = {}
+        pending = []
+
+        for filepath in filepaths:
+            skipped = self._check_scannable(filepath)
+            if skipped is not None:
+                results[filepath] = skipped
+            elif filepath not in results:
+                results[filepath] = None
+                pending.append(filepath)
+
+        return results, pending
+
+    def _check_scannable(self, filepath: str) -> Optional[NorminetteResult]:
+        """Return a result for files that should not be passed to norminette."""
         if not os.path.exists(filepath):
             logger.error(f"File not found: {filepath}")
             return NorminetteResult(filepath, "Error", [{'rule': 'FILE_NOT_FOUND', 'description': 'File not found'}])
@@ -189,47 +433,103 @@ class NorminetteScanner:
             logger.warning(f"Skipping non-C file: {filepath}")
             return NorminetteResult(filepath, "OK")
 
-        if not self._check_norminette_available():
-            logger.error("Norminette not available")
-            return NorminetteResult(filepath, "Error", [{'rule': 'NORMINETTE_NOT_FOUND', 'description': 'Norminette not available'}])
+        return None
 
-        return_code, stdout, stderr = self._run_norminette(filepath)
-        result = self._parse_norminette_output(filepath, stdout, stderr)
+    def _norminette_missing_result(self, filepath: str) -> NorminetteResult:
+        """Build the result reported when norminette cannot be run."""
+        logger.error("Norminette not available")
+        return NorminetteResult(filepath, "Error", [{'rule': 'NORMINETTE_NOT_FOUND', 'description': 'Norminette not available'}])
 
-        return result
+    def _norminette_failed_result(self, filepath: str, reason: str) -> NorminetteResult:
+        """Build the result reported for a file whose norminette batch run failed."""
+        return NorminetteResult(filepath, "Error", [{'rule': 'NORMINETTE_FAILED', 'description': f'Norminette run failed: {reason}'}])
 
-    def scan_directory(self, directory: str, recursive: bool = True) -> List[NorminetteResult]:
+    @staticmethod
+    def find_source_files(directory: str, recursive: bool = True) -> Iterator[str]:
         """
-        Scan all C files in a directory.
+        Lazily find the C source and header files in a directory.
+
+        Directories are walked with os.scandir, whose entries carry the file
+        type from the directory listing, so no extra stat() is needed per
+        entry. Symlinked directories are not followed, and directories that
+        cannot be read are skipped with a warning.
 
         Args:
             directory: Path to the directory
-            recursive: Whether to scan subdirectories
+            recursive: Whether to search subdirectories
 
-        Returns:
-            List of NorminetteResult objects
+        Yields:
+            Paths of .c and .h files
         """
-        results = []
-        path = Path(directory)
+        stack = [directory]
+
+        while stack:
+            path = stack.pop()
+            try:
+                entries = os.scandir(path)
+            except OSError as e:
+                # Like Path.glob, skip directories that cannot be read (or vanished mid-walk)
+                logger.warning(f"Skipping unreadable directory {path}: {e}")
+                continue
+
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(('.c', '.h')) and entry.is_file():
+                        yield entry.path
+
+    def scan_directory_iter(self, directory: str, recursive: bool = True) -> Iterator[NorminetteResult]:
+        """
+        Lazily scan all C files in a directory.
+
+        Results are yielded one file at a time, so callers can process them
+        as they arrive instead of waiting for the whole tree to be scanned.
 
-        if not path.exists():
+        Args:
+            directory: Path to the directory
+            recursive: Whether to scan subdirectories
+
+        Yields:
+            NorminetteResult objects
+        """
+        if not os.path.isdir(directory):
             logger.error(f"Directory not found: {directory}")
-            return results
+            return
 
-        # Find all C files
-        pattern = "**/*.c" if recursive else "*.c"
-        c_files = list(path.glob(pattern))
+        for filepath in self.find_source_files(directory, recursive):
+            yield self.scan_file(filepath)
 
-        pattern = "**/*.h" if recursive else "*.h"
-        h_files = list(path.glob(pattern))
+    def scan_directory(self, directory: str, recursive: bool = True) -> List[NorminetteResult]:
+        """
+        Scan all C files in a directory.
 
-        all_files = c_files + h_files
+        Files are checked in batches of NORMINETTE_BATCH_SIZE, one norminette
+        process per batch, with up to SCAN_WORKERS batches running at once.
 
-        logger.info(f"Found {len(all_files)} C/H files to scan")
+        Args:
+            directory: Path to the directory
+            recursive: Whether to scan subdirectories
 
-        for file_path in all_files:
-            result = self.scan_file(str(file_path))
-            results.append(result)
+        Returns:
+            List of NorminetteResult objects
+        """
+        results = []
+        if not os.path.isdir(directory):
+            logger.error(f"Directory not found: {directory}")
+        else:
+            files = self.find_source_files(directory, recursive)
+            batches = list(iter(lambda: list(islice(files, NORMINETTE_BATCH_SIZE)), []))
+            if len(batches) > 1:
+                with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(batches))) as executor:
+                    for batch_results in executor.map(self.scan_files, batches):
+                        results.extend(batch_results)
+            else:
+                for batch in batches:
+                    results.extend(self.scan_files(batch))
+
+        logger.info(f"Scanned {len(results)} C/H files")
 
         self.results = results
         return results
@@ -250,11 +550,9 @@ class NorminetteScanner:
         total_errors = sum(r.error_count for r in self.results)
 
         # Error type breakdown
-        error_types = {}
-        for result in self.results:
-            for error in result.errors:
-                error_type = error.get('type', 'unknown')
-                error_types[error_type] = error_types.get(error_type, 0) + 1
+        error_types = dict(Counter(
+            error.get('type', 'unknown') for result in self.results for error in result.errors
+        ))
 
         return {
             'total_files': total_files,
@@ -56,14 +56,13 @@ class NorminetteDashboard:
             self.aggregator = FileAggregator()
 
             # Process each scan result
+            analyses_map = {}
             for result in scan_results:
                 # Parse errors for detailed analysis
                 analyses = []
                 if result.errors:
                     analyses = self.parser.analyze_file_errors(result.errors)
-
-                # Add to aggregator
-                self.aggregator.add_scan_result(result, analyses)
+                analyses_map[result.filepath] = analyses
 
                 # Store for later use
                 self.scan_results[result.filepath] = {
@@ -71,10 +70,13 @@ class NorminetteDashboard:
                     'analyses': analyses
                 }
 
+            # Add to aggregator; file metadata is read lazily, line counts in bulk when the summary is built
+            self.aggregator.add_scan_results(scan_results, analyses_map)
+
             # Generate summary
             summary = self.aggregator.generate_project_summary()
-            recommendations = self.aggregator.get_recommendations()
-            statistics = self.aggregator.get_statistics()
+            recommendations = self.aggregator.get_recommendations(summary)
+            statistics = self.aggregator.get_statistics(summary)
 
             return {
                 'success': True,
@@ -231,7 +233,7 @@ def create_app(config=None):
         if status and status != 'all':
             try:
                 status_enum = FileStatus(status)
-                files = [f for f in files if f.status == status_enum]
+                files = [f for f in files if f.status is status_enum]
             except ValueError:
                 pass
 
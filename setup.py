@@ -3,7 +3,7 @@
 Setup script for 42-Norminette-Formatter
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 import os
 import re
 
@@ -26,6 +26,30 @@ def get_requirements():
     with open('requirements.txt', 'r') as f:
         return [line.strip() for line in f if line.strip() and not line.startswith('#')]
 
+# Optional native extensions; every one has a pure-Python fallback
+def get_ext_modules():
+    # Native LOC counter; skipped when no compiler is available
+    ext_modules = [
+        Extension(
+            'norminette_formatter.core._cloc',
+            ['norminette_formatter/core/_cloc.c'],
+            optional=True,
+        ),
+    ]
+    # Formatter kernels are plain Python that Cython can compile as-is
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return ext_modules
+    return ext_modules + cythonize(
+        [Extension(
+            'norminette_formatter.core._formatter_core',
+            ['norminette_formatter/core/_formatter_core.py'],
+            optional=True,
+        )],
+        language_level=3,
+    )
+
 setup(
     name='42-norminette-formatter',
     version=get_version(),
@@ -41,6 +65,7 @@ setup(
         'Documentation': 'https://github.com/Juskocode/42-Nominette-Formatter#readme',
     },
     packages=find_packages(exclude=['tests*']),
+    ext_modules=get_ext_modules(),
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
@@ -78,6 +103,10 @@ setup(
             'Flask>=2.3.0',
             'Flask-CORS>=4.0.0',
         ],
+        'fast': [
+            'orjson>=3.8.0',
+            'regex>=2022.1.18',
+        ],
         'all': [
             'pytest>=7.0.0',
             'pytest-cov>=4.0.0',
@@ -91,6 +120,8 @@ setup(
             'bandit>=1.7.0',
             'Flask>=2.3.0',
             'Flask-CORS>=4.0.0',
+            'orjson>=3.8.0',
+            'regex>=2022.1.18',
         ],
     },
     entry_points={
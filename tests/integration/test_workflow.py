@@ -454,6 +454,92 @@ int main(void)
         problematic_recs = [r for r in recommendations if 'problematic' in r.lower()]
         assert len(problematic_recs) > 0
 
+    
+    def test_aggregator_summary_refreshes_after_new_results(self):
+        """Test that cached summaries are rebuilt when results are added."""
+        aggregator = FileAggregator()
+        
+        aggregator.add_scan_result(NorminetteResult("good.c", "OK", []))
+        first_summary = aggregator.generate_project_summary()
+        
+        assert aggregator.generate_project_summary() is first_summary
+        assert first_summary.total_files == 1
+        
+        aggregator.add_scan_result(NorminetteResult("bad.c", "Error", [
+            {'rule': 'TOO_LONG_LINE', 'line': 1, 'column': 81, 'description': 'line too long', 'type': 'line_length'}
+        ]))
+        second_summary = aggregator.generate_project_summary()
+        
+        assert second_summary.total_files == 2
+        assert second_summary.total_errors == 1
+    
+    def test_aggregator_bulk_add_matches_single_add(self):
+        """Test that bulk ingestion produces the same file info as single adds."""
+        parser = ErrorParser()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            results = []
+            for name, body in [("a.c", "int a;\n\n/* note */\nint b;\n"), ("b.c", "int main(void)\n{\n}\n")]:
+                filepath = os.path.join(tmp_dir, name)
+                with open(filepath, 'w') as f:
+                    f.write(body)
+                results.append(NorminetteResult(filepath, "Error", [
+                    {'rule': 'SPACE_AFTER_KW', 'line': 1, 'column': 1, 'description': 'Missing space', 'type': 'spacing'}
+                ]))
+            analyses_map = {r.filepath: parser.analyze_file_errors(r.errors) for r in results}
+            
+            single = FileAggregator()
+            for result in results:
+                single.add_scan_result(result, analyses_map[result.filepath])
+            
+            bulk = FileAggregator()
+            bulk.add_scan_results(results, analyses_map)
+            
+            assert [f.filepath for f in bulk.files] == [f.filepath for f in single.files]
+            assert [f.lines_of_code for f in bulk.files] == [2, 3]
+            assert [f.lines_of_code for f in bulk.files] == [f.lines_of_code for f in single.files]
+            assert [f.auto_fixable_count for f in bulk.files] == [f.auto_fixable_count for f in single.files]
+    
+    def test_aggregator_reads_line_counts_lazily(self):
+        """Test that files are only read once line counts are needed."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "lazy.c")
+            with open(filepath, 'w') as f:
+                f.write("int a;\n")
+            
+            aggregator = FileAggregator()
+            with patch('norminette_formatter.core.aggregator._count_lines_of_code', return_value=7) as count:
+                aggregator.add_scan_results([NorminetteResult(filepath, "OK", [])])
+                aggregator.get_files_by_status()
+                aggregator.search_files("lazy")
+                assert count.call_count == 0
+                
+                assert aggregator.generate_project_summary().total_lines_of_code == 7
+                assert aggregator.files[0].lines_of_code == 7
+                assert count.call_count == 1
+    
+    def test_aggregator_summary_after_rescan(self):
+        """Test that replacing a file's result replaces its summary contribution."""
+        aggregator = FileAggregator()
+        parser = ErrorParser()
+        
+        bad = NorminetteResult("fixed.c", "Error", [
+            {'rule': 'SPACE_AFTER_KW', 'line': 1, 'column': 5, 'description': 'Missing space', 'type': 'spacing'}
+        ])
+        aggregator.add_scan_result(bad, parser.analyze_file_errors(bad.errors))
+        aggregator.add_scan_result(NorminetteResult("other.c", "OK", []))
+        
+        assert aggregator.generate_project_summary().error_distribution == {'spacing': 1}
+        
+        # Rescan after fixing
+        aggregator.add_scan_result(NorminetteResult("fixed.c", "OK", []))
+        summary = aggregator.generate_project_summary()
+        
+        assert summary.total_files == 2
+        assert summary.ok_files == 2
+        assert summary.total_errors == 0
+        assert summary.error_distribution == {}
+        assert sum(summary.severity_distribution.values()) == 0
 
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""
+Unit tests for the norminette formatter module.
+
+These tests cover:
+- Brace scanning for indentation and empty-line fixes
+- Brace placement after control statements
+- Sharing fix results between preview and format
+- Batch formatting
+- Format results reading contents back from disk
+- Restoring from backups
+"""
+
+import datetime
+import pytest
+from unittest.mock import Mock, patch
+from norminette_formatter.core.formatter import AutoFormatter
+from norminette_formatter.core.parser import ErrorParser
+from norminette_formatter.core._formatter_core import scan_braces
+
+
+class _MarkedFormatter(AutoFormatter):
+    """Formatter subclass with its own constructor, tagging every result message."""
+
+    def __init__(self, marker):
+        super().__init__(backup_enabled=False)
+        self.marker = marker
+
+    def format_file(self, filepath, error_analyses):
+        result = super().format_file(filepath, error_analyses)
+        result.message = self.marker
+        return result
+
+
+class TestAutoFormatter:
+    """Test the AutoFormatter class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.formatter = AutoFormatter(backup_enabled=False)
+
+    def test_scan_braces_skips_literals_and_comments(self):
+        """Test that braces in strings, chars and comments are not counted."""
+        lines = [
+            'int main(void) {',
+            '\tputs("{ \\" }"); c = \'{\'; // {',
+            '/* {',
+            '} */ if (x) {',
+            '}}',
+        ]
+
+        assert scan_braces(lines) == [(1, 0), (0, 0), (0, 0), (1, 0), (0, 2)]
+
+    def test_fix_indentation_ignores_braces_in_strings(self):
+        """Test that a brace in a string literal does not change indentation."""
+        content = 'int main(void)\n{\nputs("{");\nreturn (0);\n}'
+
+        formatted, changes = self.formatter._fix_indentation(content)
+
+        assert formatted == 'int main(void)\n{\n\tputs("{");\n\treturn (0);\n}'
+        assert changes == 2
+
+    def test_fix_braces_with_nested_parens_in_condition(self):
+        """Test that an opening brace is joined to a condition containing calls."""
+        content = 'if (ft_check(ft_get(x)))\n{\n\treturn (1);\n}'
+
+        formatted, changes = self.formatter._fix_braces(content)
+
+        assert formatted == 'if (ft_check(ft_get(x))) {\n\treturn (1);\n}'
+        assert changes == 1
+
+    def test_add_header_uses_replaced_template(self):
+        """Test that a header_template set after construction is the one written."""
+        self.formatter.header_template = "/* {filename} */\n"
+
+        formatted, changes = self.formatter._add_header("int x;\n", "dir/test.c")
+
+        assert formatted == "/* test.c */\nint x;\n"
+        assert changes == 1
+
+    def test_preview_then_format_runs_fixes_once(self, tmp_path):
+        """Test that formatting reuses the fixes computed for a preview."""
+        filepath = tmp_path / "test.c"
+        filepath.write_text("int\tmain(void)\n{\n    return (0);\n}\n")
+        analyses = [Mock(rule='SPACE_REPLACE_TAB', auto_fixable=True)]
+
+        with patch.object(self.formatter, '_apply_fixes', wraps=self.formatter._apply_fixes) as apply_fixes:
+            preview = self.formatter.get_format_preview(str(filepath), analyses)
+            result = self.formatter.format_file(str(filepath), analyses)
+
+        assert apply_fixes.call_count == 1
+        assert result.changes_made == 1
+        assert filepath.read_text() == preview
+
+    def test_format_multiple_files_in_process_pool(self, tmp_path):
+        """Test that a parallel batch gives the same results as formatting one by one."""
+        parser = ErrorParser()
+        analyses = [parser.analyze_error({'rule': 'SPACE_REPLACE_TAB', 'line': 3, 'column': 1,
+                                          'description': 'Found space when expecting tab'})]
+        file_analyses = {}
+        for name in ("a.c", "b.c"):
+            filepath = tmp_path / name
+            filepath.write_text("int\tmain(void)\n{\n    return (0);\n}\n")
+            file_analyses[str(filepath)] = analyses
+
+        with patch('norminette_formatter.core.formatter.PARALLEL_FORMAT_MIN_FILES', 2):
+            results = self.formatter.format_multiple_files(file_analyses)
+
+        assert list(results) == list(file_analyses)
+        assert all(result.success and result.changes_made == 1 for result in results.values())
+        assert (tmp_path / "a.c").read_text() == "int\tmain(void)\n{\n\treturn (0);\n}\n"
+
+    def test_process_pool_workers_use_a_copy_of_the_formatter(self, tmp_path):
+        """Test that pool workers format with the caller's formatter, not a freshly built one."""
+        parser = ErrorParser()
+        analyses = [parser.analyze_error({'rule': 'SPACE_REPLACE_TAB', 'line': 3, 'column': 1,
+                                          'description': 'Found space when expecting tab'})]
+        file_analyses = {}
+        for name in ("a.c", "b.c"):
+            filepath = tmp_path / name
+            filepath.write_text("int\tmain(void)\n{\n    return (0);\n}\n")
+            file_analyses[str(filepath)] = analyses
+
+        with patch('norminette_formatter.core.formatter.PARALLEL_FORMAT_MIN_FILES', 2):
+            results = _MarkedFormatter("custom").format_multiple_files(file_analyses)
+
+        assert [result.message for result in results.values()] == ["custom", "custom"]
+        assert all(result.changes_made == 1 for result in results.values())
+
+    def test_format_result_reads_contents_from_disk(self, tmp_path):
+        """Test that results read contents back from the file and its backup."""
+        formatter = AutoFormatter(backup_enabled=True)
+        formatter.backup_dir = str(tmp_path / "backups")
+        original = "int\tmain(void)\n{\n    return (0);\n}\n"
+        filepath = tmp_path / "test.c"
+        filepath.write_text(original)
+        analyses = [Mock(rule='SPACE_REPLACE_TAB', auto_fixable=True)]
+
+        result = formatter.format_file(str(filepath), analyses)
+
+        assert result.changes_made == 1
+        assert result.backup_path is not None
+        assert result.original_content == original
+        assert result.formatted_content == filepath.read_text()
+
+    def test_restore_from_backup_uses_newest_timestamp(self, tmp_path):
+        """Test that the backup with the latest timestamp in its name is restored."""
+        self.formatter.backup_dir = str(tmp_path / "backups")
+        (tmp_path / "backups").mkdir()
+        (tmp_path / "backups" / "test.c.20240102_000000.backup").write_text("newest\n")
+        (tmp_path / "backups" / "test.c.20240101_000000.backup").write_text("older\n")
+        (tmp_path / "backups" / "other.c.20250101_000000.backup").write_text("other\n")
+        filepath = tmp_path / "test.c"
+        filepath.write_text("formatted\n")
+
+        assert self.formatter.restore_from_backup(str(filepath))
+        assert filepath.read_text() == "newest\n"
+
+    def test_same_named_files_get_separate_backups(self, tmp_path):
+        """Test that files with the same name in different directories keep their own backups."""
+        formatter = AutoFormatter(backup_enabled=True)
+        formatter.backup_dir = str(tmp_path / "backups")
+        analyses = [Mock(rule='SPACE_REPLACE_TAB', auto_fixable=True)]
+        file_analyses = {}
+        for directory in ("a", "b"):
+            (tmp_path / directory).mkdir()
+            filepath = tmp_path / directory / "utils.c"
+            filepath.write_text(f"int\t{directory}(void)\n{{\n    return (0);\n}}\n")
+            file_analyses[str(filepath)] = analyses
+
+        results = formatter.format_multiple_files(file_analyses)
+        first, second = file_analyses
+        (tmp_path / "b" / "utils.c").write_text("changed\n")
+
+        assert len(list((tmp_path / "backups").iterdir())) == 2
+        assert results[first].original_content == "int\ta(void)\n{\n    return (0);\n}\n"
+        assert formatter.restore_from_backup(second)
+        assert (tmp_path / "b" / "utils.c").read_text() == "int\tb(void)\n{\n    return (0);\n}\n"
+
+    def test_backups_do_not_share_the_batch_timestamp(self, tmp_path):
+        """Test that backups made under one batch timestamp do not overwrite each other."""
+        formatter = AutoFormatter(backup_enabled=True)
+        formatter.backup_dir = str(tmp_path / "backups")
+        formatter._batch_time = datetime.datetime(2024, 1, 1)
+        filepath = tmp_path / "test.c"
+        filepath.write_text("first\n")
+        assert formatter._create_backup(str(filepath))
+        filepath.write_text("second\n")
+        assert formatter._create_backup(str(filepath))
+        filepath.write_text("formatted\n")
+
+        assert len(list((tmp_path / "backups").iterdir())) == 2
+        assert formatter.restore_from_backup(str(filepath))
+        assert filepath.read_text() == "second\n"
+
+    def test_format_file_writes_through_symlink(self, tmp_path):
+        """Test that formatting a symlink updates the file it points to and keeps the link."""
+        real = tmp_path / "real.c"
+        real.write_text("int\tmain(void)\n{\n    return (0);\n}\n")
+        link = tmp_path / "link.c"
+        link.symlink_to(real)
+        analyses = [Mock(rule='SPACE_REPLACE_TAB', auto_fixable=True)]
+
+        result = self.formatter.format_file(str(link), analyses)
+
+        assert result.success and result.changes_made == 1
+        assert link.is_symlink()
+        assert real.read_text() == "int\tmain(void)\n{\n\treturn (0);\n}\n"
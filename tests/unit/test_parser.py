@@ -29,6 +29,28 @@ class TestErrorParser:
         assert len(self.parser.error_patterns) > 0
         assert len(self.parser.fix_templates) > 0
     
+    def test_parsers_share_pattern_tables(self):
+        """Test that pattern and template tables are built once for all parsers."""
+        other = ErrorParser()
+        
+        assert other.error_patterns is self.parser.error_patterns
+        assert other.fix_templates is self.parser.fix_templates
+    
+    def test_shared_pattern_tables_are_read_only(self):
+        """Test that one parser cannot change the tables every other parser uses."""
+        with pytest.raises(TypeError):
+            self.parser.fix_templates['TOO_LONG_LINE'] = 'custom'
+        with pytest.raises(TypeError):
+            self.parser.error_patterns['TOO_LONG_LINE']['auto_fixable'] = False
+        
+        assert ErrorParser().error_patterns['TOO_LONG_LINE']['auto_fixable'] is True
+    
+    def test_error_patterns_are_compiled(self):
+        """Test that error pattern definitions hold compiled regexes."""
+        pattern = self.parser.error_patterns['TOO_LONG_LINE']['pattern']
+        
+        assert pattern.search('line too long (85/80)').group(1) == '85'
+    
     def test_analyze_error_basic(self):
         """Test basic error analysis."""
         error = {
@@ -66,6 +88,37 @@ class TestErrorParser:
         assert analysis.fix_complexity == FixComplexity.SIMPLE
         assert analysis.auto_fixable is False
     
+    def test_analyze_error_reuses_repeated_signature(self):
+        """Test that repeated (rule, description) pairs are analyzed once."""
+        errors = [
+            {'rule': 'TOO_LONG_LINE', 'line': line, 'column': 81,
+             'description': 'Line is too long (85/80)', 'type': 'line_length'}
+            for line in (1, 2)
+        ]
+        
+        with patch.object(self.parser, '_extract_context', wraps=self.parser._extract_context) as extract:
+            self.parser._analyze_signature.cache_clear()
+            first, second = self.parser.analyze_file_errors(errors)
+        
+        assert extract.call_count == 1
+        assert (first.line, second.line) == (1, 2)
+        assert first.context == second.context
+        assert first.context is not second.context
+        assert first.related_errors is not second.related_errors
+    
+    def test_error_analysis_is_immutable_and_hashable(self):
+        """Test that analyses are frozen value objects usable in sets."""
+        error = {'rule': 'TOO_LONG_LINE', 'line': 3, 'column': 81,
+                 'description': 'Line is too long (85/80)', 'type': 'line_length'}
+        
+        first = self.parser.analyze_error(error)
+        second = self.parser.analyze_error(error)
+        
+        assert first == second
+        assert len({first, second}) == 1
+        with pytest.raises(AttributeError):
+            first.line = 4
+    
     def test_extract_context_line_length(self):
         """Test context extraction for line length errors."""
         context = self.parser._extract_context('TOO_LONG_LINE', 'Line is too long (95/80)')
@@ -75,6 +128,16 @@ class TestErrorParser:
         assert context['current_length'] == 95
         assert context['excess_chars'] == 15
     
+    def test_extract_context_all_numbers_on_request(self):
+        """Test that generic numeric values are only extracted when asked for."""
+        description = 'Line is too long (95/80)'
+        
+        assert 'values' not in self.parser._extract_context('TOO_LONG_LINE', description)
+        
+        context = ErrorParser(extract_all_numbers=True)._extract_context('TOO_LONG_LINE', description)
+        
+        assert context['values'] == [95, 80]
+    
     def test_extract_context_function_lines(self):
         """Test context extraction for function line count errors."""
         context = self.parser._extract_context('TOO_MANY_LINES', 'Function has too many lines (30/25)')
@@ -169,6 +232,23 @@ class TestErrorParser:
         assert len(groups[ErrorSeverity.MEDIUM]) == 0
         assert len(groups[ErrorSeverity.LOW]) == 1
     
+    def test_count_errors_by_severity(self):
+        """Test counting errors by severity."""
+        analyses = [
+            Mock(severity=ErrorSeverity.CRITICAL),
+            Mock(severity=ErrorSeverity.CRITICAL),
+            Mock(severity=ErrorSeverity.LOW)
+        ]
+        
+        counts = self.parser.count_errors_by_severity(analyses)
+        
+        assert counts == {
+            ErrorSeverity.LOW: 1,
+            ErrorSeverity.MEDIUM: 0,
+            ErrorSeverity.HIGH: 0,
+            ErrorSeverity.CRITICAL: 2
+        }
+    
     def test_get_auto_fixable_errors(self):
         """Test filtering auto-fixable errors."""
         analyses = [
@@ -9,6 +9,7 @@ These tests cover:
 """
 
 import pytest
+import asyncio
 import tempfile
 import os
 from unittest.mock import Mock, patch, MagicMock
@@ -224,6 +225,113 @@ Error: Some malformed error message"""
         finally:
             os.unlink(tmp_path)
     
+    @patch.object(NorminetteScanner, '_check_norminette_available')
+    @patch.object(NorminetteScanner, '_run_norminette_async')
+    def test_scan_file_async_success(self, mock_run, mock_check):
+        """Test successful asynchronous file scanning."""
+        mock_check.return_value = True
+        mock_run.return_value = (1, "test.c: Error!\nError: TOO_LONG_LINE (line: 3, col: 81): line too long", "")
+        
+        with tempfile.NamedTemporaryFile(suffix='.c', delete=False) as tmp:
+            tmp.write(b"int main() { return 0; }")
+            tmp_path = tmp.name
+        
+        try:
+            result = asyncio.run(self.scanner.scan_file_async(tmp_path))
+            
+            assert result.filepath == tmp_path
+            assert result.status == "Error"
+            assert result.errors[0]['rule'] == 'TOO_LONG_LINE'
+            mock_run.assert_called_once_with(tmp_path)
+        finally:
+            os.unlink(tmp_path)
+    
+    @patch.object(NorminetteScanner, '_check_norminette_available')
+    @patch.object(NorminetteScanner, '_run_norminette')
+    def test_scan_files_batch(self, mock_run, mock_check):
+        """Test scanning several files with one norminette run."""
+        mock_check.return_value = True
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ok_path = str(Path(tmp_dir) / "ok.c")
+            bad_path = str(Path(tmp_dir) / "bad.c")
+            Path(ok_path).touch()
+            Path(bad_path).touch()
+            
+            mock_run.return_value = (1, (
+                f"{ok_path}: OK!\n"
+                f"{bad_path}: Error!\n"
+                "Error: TOO_LONG_LINE (line: 3, col: 81): line too long\n"
+            ), "")
+            
+            results = self.scanner.scan_files([ok_path, bad_path])
+            
+            mock_run.assert_called_once_with(ok_path, bad_path)
+            assert [r.filepath for r in results] == [ok_path, bad_path]
+            assert results[0].status == "OK"
+            assert results[1].status == "Error"
+            assert results[1].errors[0]['rule'] == 'TOO_LONG_LINE'
+    
+    @patch.object(NorminetteScanner, '_check_norminette_available')
+    @patch.object(NorminetteScanner, '_run_norminette')
+    def test_scan_files_rescans_unreported_file(self, mock_run, mock_check):
+        """Test that files missing from batch output are scanned alone."""
+        mock_check.return_value = True
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first = str(Path(tmp_dir) / "a.c")
+            second = str(Path(tmp_dir) / "b.c")
+            Path(first).touch()
+            Path(second).touch()
+            
+            mock_run.side_effect = [
+                (0, f"{first}: OK!\n", ""),
+                (0, f"{second}: OK!\n", "")
+            ]
+            
+            results = self.scanner.scan_files([first, second])
+            
+            assert mock_run.call_count == 2
+            mock_run.assert_called_with(second)
+            assert all(r.status == "OK" for r in results)
+    
+    @patch.object(NorminetteScanner, '_check_norminette_available')
+    @patch.object(NorminetteScanner, '_run_norminette')
+    def test_scan_files_failed_batch_not_rescanned(self, mock_run, mock_check):
+        """Test that a batch run that fails outright is not retried file by file."""
+        mock_check.return_value = True
+        mock_run.return_value = (-1, "", "Timeout")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [str(Path(tmp_dir) / name) for name in ("a.c", "b.c")]
+            for path in paths:
+                Path(path).touch()
+            
+            results = self.scanner.scan_files(paths)
+            
+            mock_run.assert_called_once_with(*paths)
+            assert all(r.status == "Error" for r in results)
+            assert all(r.errors[0]['rule'] == 'NORMINETTE_FAILED' for r in results)
+    
+    @patch.object(NorminetteScanner, '_check_norminette_available')
+    @patch.object(NorminetteScanner, '_run_norminette')
+    def test_availability_checked_once(self, mock_run, mock_check):
+        """Test that norminette availability is checked once and can be refreshed."""
+        mock_check.return_value = True
+        mock_run.return_value = (0, "OK!", "")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = str(Path(tmp_dir) / "a.c")
+            Path(filepath).touch()
+            
+            self.scanner.scan_file(filepath)
+            self.scanner.scan_file(filepath)
+            assert mock_check.call_count == 1
+            
+            mock_check.return_value = False
+            assert self.scanner.refresh_availability() is False
+            assert self.scanner.scan_file(filepath).errors[0]['rule'] == 'NORMINETTE_NOT_FOUND'
+    
     def test_scan_file_not_found(self):
         """Test scanning non-existent file."""
         result = self.scanner.scan_file("nonexistent.c")
@@ -267,15 +375,11 @@ Error: Some malformed error message"""
         finally:
             os.unlink(tmp_path)
     
-    @patch.object(NorminetteScanner, 'scan_file')
-    def test_scan_directory(self, mock_scan_file):
+    @patch.object(NorminetteScanner, 'scan_files')
+    def test_scan_directory(self, mock_scan_files):
         """Test directory scanning."""
         # Create mock results
-        mock_scan_file.side_effect = [
-            NorminetteResult("file1.c", "OK"),
-            NorminetteResult("file2.c", "Error", [{'rule': 'TEST_ERROR'}]),
-            NorminetteResult("file3.h", "OK")
-        ]
+        mock_scan_files.side_effect = lambda files: [NorminetteResult(f, "OK") for f in files]
         
         with tempfile.TemporaryDirectory() as tmp_dir:
             # Create test files
@@ -287,11 +391,96 @@ Error: Some malformed error message"""
             results = self.scanner.scan_directory(tmp_dir, recursive=False)
             
             assert len(results) == 3
-            assert mock_scan_file.call_count == 3
+            assert mock_scan_files.call_count == 1
             
             # Check that results are stored
             assert len(self.scanner.results) == 3
     
+    @patch.object(NorminetteScanner, 'scan_files')
+    def test_scan_directory_in_batches(self, mock_scan_files):
+        """Test that directory scanning passes files to norminette in concurrent batches."""
+        mock_scan_files.side_effect = lambda files: [NorminetteResult(f, "OK") for f in files]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ("a.c", "b.c", "c.h"):
+                (Path(tmp_dir) / name).touch()
+            
+            with patch('norminette_formatter.core.scanner.NORMINETTE_BATCH_SIZE', 2):
+                results = self.scanner.scan_directory(tmp_dir, recursive=False)
+            
+            assert sorted(len(call.args[0]) for call in mock_scan_files.call_args_list) == [1, 2]
+            assert sorted(r.filepath for r in results) == sorted(
+                str(Path(tmp_dir) / name) for name in ("a.c", "b.c", "c.h")
+            )
+    
+    @patch.object(NorminetteScanner, 'scan_file')
+    def test_scan_directory_iter_is_lazy(self, mock_scan_file):
+        """Test that directory scanning yields results on demand."""
+        mock_scan_file.side_effect = lambda f: NorminetteResult(f, "OK")
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            (Path(tmp_dir) / "file1.c").touch()
+            (Path(tmp_dir) / "file2.c").touch()
+            
+            results = self.scanner.scan_directory_iter(tmp_dir, recursive=False)
+            assert mock_scan_file.call_count == 0
+            
+            next(results)
+            assert mock_scan_file.call_count == 1
+            assert len(list(results)) == 1
+    
+    def test_find_source_files(self):
+        """Test source file discovery with and without recursion."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            (Path(tmp_dir) / "main.c").touch()
+            (Path(tmp_dir) / "notes.txt").touch()
+            (Path(tmp_dir) / "sub").mkdir()
+            (Path(tmp_dir) / "sub" / "util.h").touch()
+            
+            found = set(NorminetteScanner.find_source_files(tmp_dir))
+            top_level = set(NorminetteScanner.find_source_files(tmp_dir, recursive=False))
+            
+            assert found == {
+                str(Path(tmp_dir) / "main.c"),
+                str(Path(tmp_dir) / "sub" / "util.h")
+            }
+            assert top_level == {str(Path(tmp_dir) / "main.c")}
+    
+    def test_find_source_files_single_walk(self):
+        """Test that nested directories are walked once and symlinked ones are skipped."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            nested = Path(tmp_dir) / "src" / "lib" / "deep"
+            nested.mkdir(parents=True)
+            (nested / "a.c").touch()
+            (nested / "a.h").touch()
+            (nested / "a.o").touch()
+            (Path(tmp_dir) / "link").symlink_to(Path(tmp_dir) / "src", target_is_directory=True)
+            
+            with patch('os.scandir', wraps=os.scandir) as scandir:
+                found = sorted(NorminetteScanner.find_source_files(tmp_dir))
+            
+            assert found == [str(nested / "a.c"), str(nested / "a.h")]
+            assert scandir.call_count == 4
+    
+    def test_find_source_files_skips_unreadable_directory(self):
+        """Test that a directory that cannot be listed is skipped, not fatal."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for name in ("locked", "ok"):
+                (Path(tmp_dir) / name).mkdir()
+                (Path(tmp_dir) / name / "a.c").touch()
+            locked = str(Path(tmp_dir) / "locked")
+            real_scandir = os.scandir
+            
+            def scandir(path):
+                if path == locked:
+                    raise PermissionError(13, "Permission denied", path)
+                return real_scandir(path)
+            
+            with patch('os.scandir', side_effect=scandir):
+                found = list(NorminetteScanner.find_source_files(tmp_dir))
+            
+            assert found == [str(Path(tmp_dir) / "ok" / "a.c")]
+    
     def test_scan_directory_not_found(self):
         """Test scanning non-existent directory."""
         results = self.scanner.scan_directory("nonexistent_dir")